@@ -4,172 +4,314 @@ from plugins.relay import Relay
 from plugins.govee_plugin import GoveeLight
 import time
 import random
-from time import sleep
-from datetime import datetime, timedelta
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
 from plugins.music_player import MP3Player
-from scene_manager import SceneManager
+from yaml_cache import load_yaml
 import logging
+import logging.handlers
+import queue
 import sys
-import yaml
-from typing import Optional, Dict, Any
-from pathlib import Path
+from typing import Optional, Dict
 import os
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 configs_path = os.path.join(current_dir, 'configs.yaml')
-yaml_config = yaml.safe_load(open(configs_path))
+yaml_config = load_yaml(configs_path)
 detection_config = yaml_config['detection']
 warning_distance = detection_config['distance_threshold_far']
 trigger_distance = detection_config['distance_threshold_near']
-sensor_config = yaml_config['hardware']['sensors']
-ultrasonic_1_config = sensor_config['ultrasonic_1']
-ultrasonic_2_config = sensor_config['ultrasonic_2']
-ultrasonic_sensor_1 = UltrasonicSensor(ultrasonic_1_config['trigger_pin'], ultrasonic_1_config['echo_pin'])
-ultrasonic_sensor_2 = UltrasonicSensor(ultrasonic_2_config['trigger_pin'], ultrasonic_2_config['echo_pin'])
-
-motor_config = yaml_config['hardware']['motor']
-motor = Motor(motor_config['forward_pin'], motor_config['reverse_pin'])
-
-relay_config = yaml_config['hardware']['relays']
-skull_relay = Relay(relay_config['skull']['pin'], relay_config['skull']['active_high'])
-smoke_relay = Relay(relay_config['smoke']['pin'], relay_config['smoke']['active_high'])
-
-govee_config = yaml_config['hardware']['lights']['govee']
-light = GoveeLight(govee_config['ip'])
-
-scene_yaml = yaml.safe_load(open(os.path.join(current_dir, 'scenes.yaml')))
+sensor_reading_interval = detection_config.get('sensor_reading_interval', 0.1)
+scene_yaml = load_yaml(os.path.join(current_dir, 'scenes.yaml'))
 scenes = scene_yaml['scenes']
 scenes_settings = scene_yaml['settings']
 available_scenes = scenes_settings['random_scene_list']
+cooldown_after_sequence = scenes_settings.get('cooldown_after_sequence', 30)
+
+# Music files available to scenes, keyed by the name used in scenes.yaml
+MUSIC_FILE_NAMES = (
+    'opening', 'creepy', 'thump', 'zombie_scream',
+    'ghost', 'demon_growl', 'loud_thunder_1', 'loud_thunder_2',
+)
+
+# Hardware is created by init_hardware() so importing this module has no side effects
+ultrasonic_sensor_1: Optional[UltrasonicSensor] = None
+ultrasonic_sensor_2: Optional[UltrasonicSensor] = None
+motor: Optional[Motor] = None
+light: Optional[GoveeLight] = None
+relays: Dict[str, Relay] = {}
+music_files: Dict[str, MP3Player] = {}
+
+# Light commands run here so flashes don't hold up the rest of a scene. A single
+# worker keeps commands to the one light in order; the thread starts on first use.
+light_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="light")
 
-# Initialize music players
-music_files = {
-    'opening': MP3Player(f"{current_dir}/music_files/opening.mp3"),
-    'creepy': MP3Player(f"{current_dir}/music_files/creepy.mp3"),
-    'thump': MP3Player(f"{current_dir}/music_files/thump.mp3"),
-    'zombie_scream': MP3Player(f"{current_dir}/music_files/zombie_scream.mp3"),
-    'ghost': MP3Player(f"{current_dir}/music_files/ghost.mp3"),
-    'demon_growl': MP3Player(f"{current_dir}/music_files/demon_growl.mp3"),
-    'loud_thunder_1': MP3Player(f"{current_dir}/music_files/loud_thunder_1.mp3"),
-    'loud_thunder_2': MP3Player(f"{current_dir}/music_files/loud_thunder_2.mp3")
-}
-
-# Relay mapping
-relays = {
-    'skull': skull_relay,
-    'smoke': smoke_relay
-}
+# Scenes resolved against the hardware, also built by init_hardware()
+compiled_scenes: Dict[str, list] = {}
+compiled_setup_sequence: list = []
+random_scene_pool: list = []
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("HalloweenCoffin")
 
-def execute_sequence(sequence_config):
+def compile_action(action):
+    """
+    Resolve a single YAML action into a ready-to-run step.
+    
+    Args:
+        action: Action dictionary from YAML config
+        
+    Returns:
+        Tuple of (log function, log message, callable, args), or None if the
+        action cannot be run
+    """
+    action_type = action.get('type')
+    
+    if action_type == 'motor':
+        motor_action = action.get('action')
+        if motor_action == 'forward':
+            duration = action.get('duration', 2.0)
+            return (logger.info, f"Moving forward for {duration} seconds", motor.move_forward, (duration,))
+        elif motor_action == 'reverse':
+            duration = action.get('duration', 2.0)
+            return (logger.info, f"Moving reverse for {duration} seconds", motor.move_reverse, (duration,))
+        elif motor_action == 'stop':
+            return (logger.info, "Stopping motor", motor.stop, ())
+        logger.warning(f"Unknown motor action: {motor_action}")
+    elif action_type == 'relay':
+        relay_name = action.get('name')
+        relay_action = action.get('action')
+        relay = relays.get(relay_name)
+        if not relay:
+            logger.error(f"Unknown relay name: {relay_name}")
+            return None
+        if relay_action == 'on':
+            return (logger.info, f"Turning {relay_name} relay ON", relay.on, ())
+        elif relay_action == 'off':
+            return (logger.info, f"Turning {relay_name} relay OFF", relay.off, ())
+        logger.warning(f"Unknown relay action: {relay_action}")
+    elif action_type == 'light':
+        light_action = action.get('action')
+        if light_action == 'set_color':
+            colour = action.get('colour', {})
+            r = colour.get('r', 0)
+            g = colour.get('g', 0)
+            b = colour.get('b', 0)
+            return (logger.info, f"Setting light color to RGB({r}, {g}, {b})", light.set_color, (r, g, b))
+        elif light_action == 'flash':
+            amount = action.get('amount', 10)
+            return (logger.info, f"Flashing light {amount} times", light.flash, (amount,))
+        logger.warning(f"Unknown light action: {light_action}")
+    elif action_type == 'music':
+        file_name = action.get('file')
+        music_action = action.get('action')
+        
+        if music_action == 'play':
+            # Handle file names with or without .mp3 extension
+            lookup_name = file_name.replace('.mp3', '') if file_name else None
+            player = music_files.get(lookup_name)
+            if not player:
+                logger.error(f"Unknown music file: {file_name}")
+                return None
+            # Decode now so the first trigger doesn't pay for it
+            player.preload()
+            return (logger.info, f"Playing music: {file_name}", player.play, ())
+        logger.warning(f"Unknown music action: {music_action}")
+    elif action_type == 'sleep':
+        duration = action.get('duration', 1.0)
+        return (logger.debug, f"Sleeping for {duration} seconds", time.sleep, (duration,))
+    else:
+        logger.warning(f"Unknown action type: {action_type}")
+    
+    return None
+
+def compile_sequence(sequence_config):
     """
-    Execute a sequence of actions from YAML configuration.
+    Resolve a sequence of YAML actions once so triggering it is a plain call loop.
     
     Args:
         sequence_config: List of action dictionaries from YAML config
+        
+    Returns:
+        List of (log function, log message, callable, args) steps
+    """
+    compiled = []
+    light_batch = []
+    for action in sequence_config or []:
+        step = compile_action(action)
+        if step is None:
+            continue
+        if action.get('type') == 'light':
+            # Adjacent light actions are handed to the light worker as one job
+            light_batch.append(step)
+            continue
+        if light_batch:
+            compiled.append(batch_light_steps(light_batch))
+            light_batch = []
+        compiled.append(step)
+    if light_batch:
+        compiled.append(batch_light_steps(light_batch))
+    return compiled
+
+def batch_light_steps(light_steps):
     """
-    for action in sequence_config:
-        action_type = action.get('type')
+    Fuse a run of light steps into a single step queued on the light worker.
+    
+    Args:
+        light_steps: Compiled light steps, in sequence order
         
+    Returns:
+        One (log function, log message, callable, args) step
+    """
+    message = "; ".join(message for _, message, _, _ in light_steps)
+    calls = tuple((func, args) for _, _, func, args in light_steps)
+    return (logger.info, message, light_executor.submit, (run_light_steps, calls))
+
+def run_light_steps(calls):
+    """
+    Run a batch of light commands back to back on the light worker.
+    
+    Args:
+        calls: Tuple of (callable, args) pairs
+    """
+    for func, args in calls:
         try:
-            if action_type == 'motor':
-                motor_action = action.get('action')
-                if motor_action == 'forward':
-                    duration = action.get('duration', 2.0)
-                    logger.info(f"Moving forward for {duration} seconds")
-                    motor.move_forward(duration)
-                elif motor_action == 'reverse':
-                    duration = action.get('duration', 2.0)
-                    logger.info(f"Moving reverse for {duration} seconds")
-                    motor.move_reverse(duration)
-                elif motor_action == 'stop':
-                    logger.info("Stopping motor")
-                    motor.stop()
-            elif action_type == 'relay':
-                relay_name = action.get('name')
-                relay_action = action.get('action')
-                relay = relays.get(relay_name)
-                if not relay:
-                    logger.error(f"Unknown relay name: {relay_name}")
-                    continue
-                if relay_action == 'on':
-                    logger.info(f"Turning {relay_name} relay ON")
-                    relay.on()
-                elif relay_action == 'off':
-                    logger.info(f"Turning {relay_name} relay OFF")
-                    relay.off()
-            elif action_type == 'light':
-                light_action = action.get('action')
-                if light_action == 'set_color':
-                    r = action.get('colour', {}).get('r', 0)
-                    g = action.get('colour', {}).get('g', 0)
-                    b = action.get('colour', {}).get('b', 0)
-                    logger.info(f"Setting light color to RGB({r}, {g}, {b})")
-                    light.set_color(r, g, b)
-                elif light_action == 'flash':
-                    amount = action.get('amount', 10)
-                    logger.info(f"Flashing light {amount} times")
-                    light.flash(amount)
-                    
-            elif action_type == 'music':
-                file_name = action.get('file')
-                music_action = action.get('action')
-                
-                if music_action == 'play':
-                    # Handle file names with or without .mp3 extension
-                    lookup_name = file_name.replace('.mp3', '') if file_name else None
-                    player = music_files.get(lookup_name)
-                    if not player:
-                        logger.error(f"Unknown music file: {file_name}")
-                        continue
-                    logger.info(f"Playing music: {file_name}")
-                    player.play()
-                    
-            elif action_type == 'sleep':
-                duration = action.get('duration', 1.0)
-                logger.debug(f"Sleeping for {duration} seconds")
-                time.sleep(duration)
-                
-            else:
-                logger.warning(f"Unknown action type: {action_type}")
-                
+            func(*args)
         except Exception as e:
-            logger.error(f"Error executing action {action}: {e}")
-            continue
+            logger.error(f"Error executing light action: {e}")
+
+def execute_sequence(compiled_sequence):
+    """
+    Execute a compiled sequence of actions.
+    
+    Args:
+        compiled_sequence: Steps produced by compile_sequence()
+    """
+    for log, message, func, args in compiled_sequence:
+        try:
+            log(message)
+            func(*args)
+        except Exception as e:
+            logger.error(f"Error executing action '{message}': {e}")
+
+def init_hardware():
+    """
+    Create every hardware object once and resolve the scenes against them.
+    
+    Music players are constructed for every track, but only the tracks a
+    scene actually plays are decoded up front.
+    """
+    global ultrasonic_sensor_1, ultrasonic_sensor_2, motor, light
+    global compiled_setup_sequence
+    
+    hardware_config = yaml_config['hardware']
+    sensor_config = hardware_config['sensors']
+    ultrasonic_1_config = sensor_config['ultrasonic_1']
+    ultrasonic_2_config = sensor_config['ultrasonic_2']
+    ultrasonic_sensor_1 = UltrasonicSensor(ultrasonic_1_config['trigger_pin'], ultrasonic_1_config['echo_pin'])
+    ultrasonic_sensor_2 = UltrasonicSensor(ultrasonic_2_config['trigger_pin'], ultrasonic_2_config['echo_pin'])
+    
+    motor_config = hardware_config['motor']
+    motor = Motor(motor_config['forward_pin'], motor_config['reverse_pin'])
+    
+    relay_config = hardware_config['relays']
+    relays.clear()
+    for relay_name in ('skull', 'smoke'):
+        relays[relay_name] = Relay(relay_config[relay_name]['pin'], relay_config[relay_name]['active_high'])
+    
+    govee_config = hardware_config['lights']['govee']
+    light = GoveeLight(govee_config['ip'])
+    
+    music_files.clear()
+    for music_name in MUSIC_FILE_NAMES:
+        music_files[music_name] = MP3Player(os.path.join(current_dir, 'music_files', f"{music_name}.mp3"))
+    
+    # Scenes are resolved against the hardware once, not on every trigger
+    compiled_scenes.clear()
+    for name, scene in scenes.items():
+        compiled_scenes[name] = compile_sequence(scene.get('sequence'))
+    compiled_setup_sequence = compile_sequence(scene_yaml.get('setup_sequence', []))
+    
+    # Random selection pool, resolved to compiled sequences once
+    random_scene_pool.clear()
+    for scene_name in available_scenes:
+        if scene_name in compiled_scenes:
+            random_scene_pool.append((scene_name, compiled_scenes[scene_name]))
+        else:
+            logger.error(f"Unknown scene in random_scene_list: {scene_name}")
 
 def get_shortest_distance():
     """Get the shortest distance from the two ultrasonic sensors."""
-    distance_1 = ultrasonic_sensor_1.read_distance()
-    distance_2 = ultrasonic_sensor_2.read_distance()
+    # Read in turn, far enough apart that neither hears the other's ping
+    distance_1, distance_2 = UltrasonicSensor.read_distances((ultrasonic_sensor_1, ultrasonic_sensor_2))
     if not distance_1 or not distance_2:
         return None
     return min(distance_1, distance_2)
 
 def setup_hardware():
     """Setup hardware using sequence from YAML configuration."""
-    setup_sequence_config = scene_yaml.get('setup_sequence', [])
     logger.info("Running hardware setup sequence")
-    execute_sequence(setup_sequence_config)
+    execute_sequence(compiled_setup_sequence)
+
+def start_log_listener():
+    """
+    Put the root log handlers behind a queue serviced by a background thread.
+    
+    Logging calls on the trigger path then only enqueue a record; formatting
+    and writing to the console happen on the listener thread.
+    
+    Returns:
+        The started QueueListener; stop() it to flush on exit
+    """
+    root_logger = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
 
 def main():
     """Main entry point."""
-    setup_hardware()
-    while True:
-        sequence_config = random.choice(available_scenes)
-        sequence_config = scenes.get(sequence_config)
-        distance = get_shortest_distance()
-        if not distance:
-            continue
-        if distance < warning_distance:
-            logger.info(f"Distance: {distance} cm")
-            logger.info("Warning: Object is approaching")
-        if distance < trigger_distance:
-            logger.info(f"Distance: {distance} cm")
-            logger.info("Trigger: Object is close")
-            execute_sequence(sequence_config.get("sequence"))
+    log_listener = start_log_listener()
+    try:
+        init_hardware()
+        setup_hardware()
+        if not random_scene_pool:
+            logger.error("No scenes available for random selection")
+            return 1
+        # Monotonic clock, so NTP or manual clock changes can't skip or stretch the cooldown
+        last_sequence_time = -float(cooldown_after_sequence)
+        while True:
+            # Pace the sensors instead of re-triggering them back to back
+            time.sleep(sensor_reading_interval)
+            distance = get_shortest_distance()
+            if not distance:
+                continue
+            if distance < warning_distance:
+                logger.info(f"Distance: {distance} cm")
+                logger.info("Warning: Object is approaching")
+            if distance < trigger_distance:
+                logger.info(f"Distance: {distance} cm")
+                time_since_last_sequence = time.monotonic() - last_sequence_time
+                if time_since_last_sequence < cooldown_after_sequence:
+                    remaining_cooldown = cooldown_after_sequence - time_since_last_sequence
+                    logger.debug("Person detected but cooldown active (%.1fs remaining)", remaining_cooldown)
+                    continue
+                logger.info("Trigger: Object is close")
+                # Only pick a scene when one is actually going to run
+                scene_name, sequence = random_scene_pool[random.randrange(len(random_scene_pool))]
+                logger.info(f"Running scene: {scene_name}")
+                execute_sequence(sequence)
+                last_sequence_time = time.monotonic()
+    finally:
+        # Drop queued light commands and cut short a running flash, so the
+        # light worker is done before the process exits
+        light_executor.shutdown(wait=False, cancel_futures=True)
+        if light:
+            light.stop_flash()
+        light_executor.shutdown(wait=True)
+        if light:
+            light.close()
+        log_listener.stop()
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -6,27 +6,52 @@ import time
 import random
 from time import sleep
 from datetime import datetime, timedelta
-from threading import Thread
+from threading import Event, Thread
+import queue
 from plugins.music_player import MP3Player
 from scene_manager import SceneManager
+from yaml_cache import load_yaml
+import atexit
+import signal
 import logging
+import logging.handlers
 import sys
 import yaml
 from typing import Optional, Dict, Any
+from dataclasses import dataclass
 from pathlib import Path
 
 # Global scene manager
 scene_manager: Optional[SceneManager] = None
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/home/halloweencoffin/halloween_coffin/logs/coffin.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Records are handed to a queue; a QueueListener thread does the formatting
+# and I/O so the sensor loop never blocks on a write(). File output is
+# buffered and flushed every LOG_BUFFER_RECORDS records, on any WARNING or
+# above, every LOG_FLUSH_INTERVAL seconds, and at shutdown.
+LOG_BUFFER_RECORDS = 256
+LOG_FLUSH_INTERVAL = 1.0  # seconds
+LOG_QUEUE: queue.Queue = queue.Queue(-1)
+
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('/home/halloweencoffin/halloween_coffin/logs/coffin.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+_memory_handler = logging.handlers.MemoryHandler(LOG_BUFFER_RECORDS, flushLevel=logging.WARNING, target=_file_handler)
+
+# Attached to the root logger by start_log_listener(). Handlers are attached
+# directly: basicConfig would give the QueueHandler a formatter and the
+# listener's handlers would then format each message twice
+LOG_QUEUE_HANDLER = logging.handlers.QueueHandler(LOG_QUEUE)
+LOG_LISTENER = logging.handlers.QueueListener(LOG_QUEUE, _memory_handler, _stream_handler)
+LOG_LISTENER_RUNNING = False
+
+# Flushes the file buffer on a timer so a quiet stretch still reaches the log
+LOG_FLUSH_STOP = Event()
+LOG_FLUSH_THREAD: Optional[Thread] = None
+
+logging.getLogger().setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Hardware configuration - will be initialized in main()
@@ -46,9 +71,155 @@ THUMP_SOUND: Optional[MP3Player] = None
 SYSTEM_INITIALIZED = False
 SEQUENCE_RUNNING = False
 
+# Set by the SIGTERM/SIGINT handler; the main loop waits on it between readings
+SHUTDOWN_EVENT = Event()
+
+# Light changes are queued to one persistent worker thread (see start_light_worker)
+LIGHT_QUEUE: queue.Queue = queue.Queue()
+LIGHT_WORKER: Optional[Thread] = None
+WORKER_JOIN_TIMEOUT = 2.0  # seconds to wait for the light worker to exit at cleanup
+
 # Global configuration - loaded from configs.yaml
 CONFIG: Optional[Dict[str, Any]] = None
 
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """
+    Configuration values used by the main loop, resolved once at startup.
+    
+    Attributes:
+        max_sensor_retries: Sensor read attempts before falling back
+        default_safe_distance: Distance reported when the sensors fail (cm)
+        distance_threshold_near: Distance that triggers a sequence (cm)
+        sensor_reading_interval: Delay between sensor readings (seconds)
+        cooldown_after_sequence: Minimum time between sequences (seconds)
+    """
+    max_sensor_retries: int
+    default_safe_distance: float
+    distance_threshold_near: float
+    sensor_reading_interval: float
+    cooldown_after_sequence: float
+
+# Resolved by initialize_system() so the main loop doesn't walk the config dicts
+RUNTIME_CONFIG: Optional[RuntimeConfig] = None
+
+def get_runtime_config() -> RuntimeConfig:
+    """
+    Get the runtime configuration resolved by initialize_system().
+    
+    Returns:
+        RuntimeConfig: The resolved configuration
+        
+    Raises:
+        RuntimeError: If initialize_system() has not resolved it yet
+    """
+    if RUNTIME_CONFIG is None:
+        raise RuntimeError("System not initialized")
+    return RUNTIME_CONFIG
+
+@dataclass(frozen=True)
+class MotorConfig:
+    """Door motor pins (BCM numbering)."""
+    forward_pin: int
+    reverse_pin: int
+
+@dataclass(frozen=True)
+class RelayConfig:
+    """Relay pin (BCM numbering) and polarity."""
+    pin: int
+    active_high: bool
+
+@dataclass(frozen=True)
+class SensorConfig:
+    """Ultrasonic sensor pins (BCM numbering)."""
+    trigger_pin: int
+    echo_pin: int
+
+@dataclass(frozen=True)
+class HardwareConfig:
+    """
+    The hardware section of configs.yaml, with defaults applied in one place.
+    
+    Attributes:
+        motor: Door motor pins
+        skull_relay: Skull relay settings
+        smoke_relay: Smoke machine relay settings
+        sensor_1: First ultrasonic sensor pins
+        sensor_2: Second ultrasonic sensor pins
+        govee_ip: IP address of the Govee light
+        audio_files: Full paths of the opening, creepy and thump sounds
+    """
+    motor: MotorConfig
+    skull_relay: RelayConfig
+    smoke_relay: RelayConfig
+    sensor_1: SensorConfig
+    sensor_2: SensorConfig
+    govee_ip: str
+    audio_files: Dict[str, str]
+    
+    @classmethod
+    def from_dict(cls, hw_config: Dict[str, Any]) -> "HardwareConfig":
+        """
+        Build the hardware configuration from the parsed YAML section.
+        
+        Args:
+            hw_config: The 'hardware' mapping from configs.yaml
+            
+        Returns:
+            HardwareConfig: Validated configuration with defaults filled in
+        """
+        motor_config = hw_config.get('motor', {})
+        relays_config = hw_config.get('relays', {})
+        skull_config = relays_config.get('skull', {})
+        smoke_config = relays_config.get('smoke', {})
+        sensors_config = hw_config.get('sensors', {})
+        sensor1_config = sensors_config.get('ultrasonic_1', {})
+        sensor2_config = sensors_config.get('ultrasonic_2', {})
+        govee_config = hw_config.get('lights', {}).get('govee', {})
+        audio_config = hw_config.get('audio', {})
+        base_path = audio_config.get('base_path', '/home/halloweencoffin/halloween_coffin/music_files')
+        files = audio_config.get('files', {})
+        
+        return cls(
+            motor=MotorConfig(int(motor_config.get('forward_pin', 5)), int(motor_config.get('reverse_pin', 6))),
+            skull_relay=RelayConfig(int(skull_config.get('pin', 16)), cls._parse_bool(skull_config.get('active_high', True), 'skull active_high')),
+            smoke_relay=RelayConfig(int(smoke_config.get('pin', 20)), cls._parse_bool(smoke_config.get('active_high', True), 'smoke active_high')),
+            sensor_1=SensorConfig(int(sensor1_config.get('trigger_pin', 8)), int(sensor1_config.get('echo_pin', 7))),
+            sensor_2=SensorConfig(int(sensor2_config.get('trigger_pin', 23)), int(sensor2_config.get('echo_pin', 24))),
+            govee_ip=str(govee_config.get('ip', '192.168.1.210')),
+            audio_files={
+                name: f"{base_path}/{files.get(name, f'{name}.mp3')}"
+                for name in ('opening', 'creepy', 'thump')
+            }
+        )
+    
+    @staticmethod
+    def _parse_bool(value: Any, name: str) -> bool:
+        """
+        Read a YAML flag, accepting a quoted "true"/"false" as well as a boolean.
+        
+        bool() would turn the string "false" into True, inverting a relay.
+        
+        Args:
+            value: Value from the YAML
+            name: Setting name, for the error message
+            
+        Returns:
+            bool: The flag's value
+            
+        Raises:
+            ValueError: If the value is not a recognisable boolean
+        """
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in ('true', 'yes', 'on', '1'):
+                return True
+            if lowered in ('false', 'no', 'off', '0'):
+                return False
+        raise ValueError(f"Invalid boolean for {name}: {value!r}")
+
 def load_config() -> Optional[Dict[str, Any]]:
     """
     Load configuration from configs.yaml file.
@@ -63,8 +234,8 @@ def load_config() -> Optional[Dict[str, Any]]:
             logger.error(f"Configuration file not found: {config_file}")
             return None
         
-        with open(config_file, 'r') as file:
-            CONFIG = yaml.safe_load(file)
+        # Parsed with libyaml when available and reused while the file is unchanged
+        CONFIG = load_yaml(config_file)
         
         logger.info(f"Configuration loaded from {config_file}")
         return CONFIG
@@ -76,6 +247,49 @@ def load_config() -> Optional[Dict[str, Any]]:
         logger.error(f"Error loading configuration: {e}")
         return None
 
+def _log_flush_loop() -> None:
+    """
+    Flush buffered file log records every LOG_FLUSH_INTERVAL seconds until stopped.
+    """
+    while not LOG_FLUSH_STOP.wait(LOG_FLUSH_INTERVAL):
+        _memory_handler.flush()
+
+def start_log_listener() -> None:
+    """
+    Route log records through the queue and start the threads that write them.
+    
+    The listener is stopped, and buffered records written out, at exit.
+    """
+    global LOG_LISTENER_RUNNING, LOG_FLUSH_THREAD
+    
+    if LOG_LISTENER_RUNNING:
+        return
+    LOG_LISTENER.start()
+    logging.getLogger().addHandler(LOG_QUEUE_HANDLER)
+    LOG_FLUSH_STOP.clear()
+    LOG_FLUSH_THREAD = Thread(target=_log_flush_loop, name="log-flush", daemon=True)
+    LOG_FLUSH_THREAD.start()
+    LOG_LISTENER_RUNNING = True
+    atexit.register(stop_log_listener)
+
+def stop_log_listener() -> None:
+    """
+    Write out any queued log records and stop the log listener threads.
+    """
+    global LOG_LISTENER_RUNNING, LOG_FLUSH_THREAD
+    
+    if not LOG_LISTENER_RUNNING:
+        return
+    logging.getLogger().removeHandler(LOG_QUEUE_HANDLER)
+    LOG_FLUSH_STOP.set()
+    if LOG_FLUSH_THREAD is not None:
+        LOG_FLUSH_THREAD.join()
+        LOG_FLUSH_THREAD = None
+    LOG_LISTENER.stop()
+    LOG_LISTENER_RUNNING = False
+    for handler in LOG_LISTENER.handlers:
+        handler.flush()
+
 def initialize_system() -> bool:
     """
     Initialize the entire system including scene manager and hardware.
@@ -83,9 +297,10 @@ def initialize_system() -> bool:
     Returns:
         bool: True if system initialized successfully, False otherwise
     """
-    global scene_manager, SYSTEM_INITIALIZED
+    global scene_manager, SYSTEM_INITIALIZED, RUNTIME_CONFIG
     
     try:
+        start_log_listener()
         logger.info("Initializing Halloween Coffin System...")
         
         # Load configuration first
@@ -116,6 +331,16 @@ def initialize_system() -> bool:
         }
         scene_manager.set_hardware_references(hardware_refs)
         
+        start_light_worker()
+        
+        RUNTIME_CONFIG = RuntimeConfig(
+            max_sensor_retries=get_config_value('detection', 'max_sensor_retries', 5),
+            default_safe_distance=get_config_value('detection', 'default_safe_distance', 200.0),
+            distance_threshold_near=get_config_value('detection', 'distance_threshold_near', 50),
+            sensor_reading_interval=get_config_value('detection', 'sensor_reading_interval', 0.5),
+            cooldown_after_sequence=get_config_value('settings', 'cooldown_after_sequence', 30)
+        )
+        
         SYSTEM_INITIALIZED = True
         logger.info("System initialized successfully")
         return True
@@ -138,53 +363,41 @@ def initialize_hardware() -> bool:
         logger.info("Initializing hardware components...")
         
         # Get hardware configuration from global CONFIG
-        hw_config = CONFIG.get('hardware', {})
+        hw = HardwareConfig.from_dict(CONFIG.get('hardware', {}))
         
         # Initialize motor
-        motor_config = hw_config.get('motor', {})
-        DOOR_MOTOR = Motor(motor_config.get('forward_pin', 5), motor_config.get('reverse_pin', 6))
+        DOOR_MOTOR = Motor(hw.motor.forward_pin, hw.motor.reverse_pin)
         if not DOOR_MOTOR.is_initialized():
             raise RuntimeError("Failed to initialize door motor")
         
         # Initialize relays
-        relays_config = hw_config.get('relays', {})
-        
-        skull_config = relays_config.get('skull', {})
-        SKULL_RELAY = Relay(skull_config.get('pin', 16), active_high=skull_config.get('active_high', True))
+        SKULL_RELAY = Relay(hw.skull_relay.pin, active_high=hw.skull_relay.active_high)
         if not SKULL_RELAY.is_initialized():
             raise RuntimeError("Failed to initialize skull relay")
         
-        smoke_config = relays_config.get('smoke', {})
-        SMOKE_RELAY = Relay(smoke_config.get('pin', 20), active_high=smoke_config.get('active_high', True))
+        SMOKE_RELAY = Relay(hw.smoke_relay.pin, active_high=hw.smoke_relay.active_high)
         if not SMOKE_RELAY.is_initialized():
             raise RuntimeError("Failed to initialize smoke relay")
         
         # Initialize ultrasonic sensors
-        sensors_config = hw_config.get('sensors', {})
-        
-        sensor1_config = sensors_config.get('ultrasonic_1', {})
-        ULTRASONIC_SENSOR_1 = UltrasonicSensor(sensor1_config.get('trigger_pin', 8), sensor1_config.get('echo_pin', 7))
+        ULTRASONIC_SENSOR_1 = UltrasonicSensor(hw.sensor_1.trigger_pin, hw.sensor_1.echo_pin)
         if not ULTRASONIC_SENSOR_1.is_initialized():
             raise RuntimeError("Failed to initialize ultrasonic sensor 1")
         
-        sensor2_config = sensors_config.get('ultrasonic_2', {})
-        ULTRASONIC_SENSOR_2 = UltrasonicSensor(sensor2_config.get('trigger_pin', 23), sensor2_config.get('echo_pin', 24))
+        ULTRASONIC_SENSOR_2 = UltrasonicSensor(hw.sensor_2.trigger_pin, hw.sensor_2.echo_pin)
         if not ULTRASONIC_SENSOR_2.is_initialized():
             raise RuntimeError("Failed to initialize ultrasonic sensor 2")
         
         # Initialize lights
-        lights_config = hw_config.get('lights', {})
-        govee_config = lights_config.get('govee', {})
-        COFFIN_LIGHTS = GoveeLight(govee_config.get('ip', '192.168.1.210'))
+        COFFIN_LIGHTS = GoveeLight(hw.govee_ip)
         
         # Initialize audio players
-        audio_config = hw_config.get('audio', {})
-        base_path = audio_config.get('base_path', '/home/halloweencoffin/halloween_coffin/music_files')
-        files = audio_config.get('files', {})
-        
-        OPENING_SOUND = MP3Player(f"{base_path}/{files.get('opening', 'opening.mp3')}")
-        CREEPY_SOUND = MP3Player(f"{base_path}/{files.get('creepy', 'creepy.mp3')}")
-        THUMP_SOUND = MP3Player(f"{base_path}/{files.get('thump', 'thump.mp3')}")
+        OPENING_SOUND = MP3Player(hw.audio_files['opening'])
+        CREEPY_SOUND = MP3Player(hw.audio_files['creepy'])
+        THUMP_SOUND = MP3Player(hw.audio_files['thump'])
+        # Open the mixer and decode now so the first scene doesn't wait on it
+        for sound in (OPENING_SOUND, CREEPY_SOUND, THUMP_SOUND):
+            sound.preload()
         
         logger.info("All hardware components initialized successfully")
         return True
@@ -202,36 +415,82 @@ def cleanup_hardware() -> None:
     
     logger.info("Cleaning up hardware...")
     
-    try:
-        if DOOR_MOTOR:
-            DOOR_MOTOR.cleanup()
-        if SKULL_RELAY:
-            SKULL_RELAY.cleanup()
-        if SMOKE_RELAY:
-            SMOKE_RELAY.cleanup()
-        if ULTRASONIC_SENSOR_1:
-            ULTRASONIC_SENSOR_1.cleanup()
-        if ULTRASONIC_SENSOR_2:
-            ULTRASONIC_SENSOR_2.cleanup()
-        if COFFIN_LIGHTS:
-            COFFIN_LIGHTS.close()
-        if OPENING_SOUND:
-            OPENING_SOUND.cleanup()
-        if CREEPY_SOUND:
-            CREEPY_SOUND.cleanup()
-        if THUMP_SOUND:
-            THUMP_SOUND.cleanup()
-            
-        SYSTEM_INITIALIZED = False
-        logger.info("Hardware cleanup completed")
-        
-    except Exception as e:
-        logger.error(f"Error during hardware cleanup: {e}")
+    stop_light_worker()
+    
+    # Each component gets its own try so one failure can't leave the rest running
+    components = (
+        ('door motor', DOOR_MOTOR, 'cleanup'),
+        ('skull relay', SKULL_RELAY, 'cleanup'),
+        ('smoke relay', SMOKE_RELAY, 'cleanup'),
+        ('ultrasonic sensor 1', ULTRASONIC_SENSOR_1, 'cleanup'),
+        ('ultrasonic sensor 2', ULTRASONIC_SENSOR_2, 'cleanup'),
+        ('coffin lights', COFFIN_LIGHTS, 'close'),
+        ('opening sound', OPENING_SOUND, 'cleanup'),
+        ('creepy sound', CREEPY_SOUND, 'cleanup'),
+        ('thump sound', THUMP_SOUND, 'cleanup'),
+    )
+    for name, component, method in components:
+        if not component:
+            continue
+        try:
+            getattr(component, method)()
+        except Exception as e:
+            logger.error(f"Error cleaning up {name}: {e}")
+    
+    SYSTEM_INITIALIZED = False
+    logger.info("Hardware cleanup completed")
+
+def _queue_worker(work_queue: queue.Queue) -> None:
+    """
+    Run queued jobs one at a time until the None sentinel arrives.
+    
+    Args:
+        work_queue: Queue of callables to run
+    """
+    while True:
+        job = work_queue.get()
+        if job is None:
+            break
+        job()
+
+def start_light_worker() -> None:
+    """
+    Start the light worker thread if it is not already running.
+    """
+    global LIGHT_WORKER
+    
+    if LIGHT_WORKER and LIGHT_WORKER.is_alive():
+        return
+    LIGHT_WORKER = Thread(target=_queue_worker, args=(LIGHT_QUEUE,), daemon=True)
+    LIGHT_WORKER.start()
+
+def stop_light_worker() -> None:
+    """
+    Drop any queued light changes and wait for the light worker to exit.
+    """
+    global LIGHT_WORKER
+    
+    # Changes still waiting would otherwise be sent after shutdown
+    while True:
+        try:
+            LIGHT_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+    
+    # Cut short a flash in progress, so it neither holds up the join nor
+    # keeps sending once the light's socket is closed
+    if COFFIN_LIGHTS:
+        COFFIN_LIGHTS.stop_flash()
+    
+    if LIGHT_WORKER and LIGHT_WORKER.is_alive():
+        LIGHT_QUEUE.put(None)
+        LIGHT_WORKER.join(WORKER_JOIN_TIMEOUT)
+    LIGHT_WORKER = None
 
 def process_lights(light: GoveeLight, red: int = 0, green: int = 0, blue: int = 0, 
                   flash: bool = False, flash_amount: int = 10, off: bool = False, on: bool = False) -> bool:
     """
-    Process light changes in a separate thread with validation.
+    Queue light changes for the light worker thread with validation.
     
     Args:
         light: The light object to control
@@ -250,11 +509,10 @@ def process_lights(light: GoveeLight, red: int = 0, green: int = 0, blue: int =
     
     def change_lights():
         try:
-            if on:
-                light.turn_on()
-            
-            # Set color regardless of on/off state
-            if not light.set_color(red, green, blue):
+            # Set color regardless of on/off state; turning on is folded in
+            # and skipped when the light is already on
+            color_set = light.set_on_and_color(red, green, blue) if on else light.set_color(red, green, blue)
+            if not color_set:
                 logger.warning("Failed to set light color")
             
             if flash:
@@ -266,8 +524,8 @@ def process_lights(light: GoveeLight, red: int = 0, green: int = 0, blue: int =
             logger.error(f"Error in light control: {e}")
     
     logger.info(f"Switching lights to RGB({red}, {green}, {blue}) - Flash: {flash}, On: {on}, Off: {off}")
-    thread = Thread(target=change_lights, daemon=True)
-    thread.start()
+    start_light_worker()
+    LIGHT_QUEUE.put(change_lights)
     return True
 
 def get_shortest_distance() -> float:
@@ -281,8 +539,8 @@ def get_shortest_distance() -> float:
         logger.error("Sensors not initialized")
         return get_config_value('detection', 'default_safe_distance', 200.0)
     
-    # Get configuration values
-    max_retries = get_config_value('detection', 'max_sensor_retries', 5)
+    runtime_config = get_runtime_config()
+    max_retries = runtime_config.max_sensor_retries
     retry_count = 0
     
     while retry_count < max_retries:
@@ -292,7 +550,7 @@ def get_shortest_distance() -> float:
             
             if distance_1 is not None and distance_2 is not None:
                 min_distance = min(distance_1, distance_2)
-                logger.debug(f"Sensor readings: {distance_1:.1f}cm, {distance_2:.1f}cm -> {min_distance:.1f}cm")
+                logger.debug("Sensor readings: %.1fcm, %.1fcm -> %.1fcm", distance_1, distance_2, min_distance)
                 return min_distance
         except Exception as e:
             logger.error(f"Error reading sensor data (attempt {retry_count + 1}): {e}")
@@ -302,7 +560,7 @@ def get_shortest_distance() -> float:
     
     # Return a safe default distance if sensors fail
     logger.warning("Unable to read sensor data after retries, using default distance")
-    return get_config_value('detection', 'default_safe_distance', 200.0)
+    return runtime_config.default_safe_distance
 
 def get_config_value(section: str, key: str, default_value: Any = None) -> Any:
     """
@@ -317,17 +575,16 @@ def get_config_value(section: str, key: str, default_value: Any = None) -> Any:
         Configuration value or default
     """
     try:
-        if section == 'detection':
-            config = CONFIG.get('detection', {}) if CONFIG else {}
-        elif section == 'hardware':
-            config = CONFIG.get('hardware', {}) if CONFIG else {}
+        if section == 'detection' or section == 'hardware':
+            config = CONFIG.get(section) if CONFIG else None
         elif section == 'settings':
-            config = scene_manager.get_settings() if scene_manager else {}
+            config = scene_manager.get_settings() if scene_manager else None
         else:
             return default_value
         
-        return config.get(key, default_value)
+        return config.get(key, default_value) if config else default_value
     except Exception as e:
+        # e.g. a config file that loaded as None or a section that isn't a mapping
         logger.error(f"Error getting config value {section}.{key}: {e}")
         return default_value
 
@@ -392,8 +649,8 @@ def run_halloween_sequence() -> bool:
         # Check if random scene mode is enabled
         random_mode = get_config_value('settings', 'random_scene_mode', False)
         if random_mode:
-            # Get all available scenes from the scene manager
-            available_scenes = scene_manager.get_scene_names(exclude_test_scenes=True)
+            # Get all available scenes from the scene manager (cached at load time)
+            available_scenes = scene_manager.get_runtime_scene_names()
             
             if available_scenes:
                 scene_name = random.choice(available_scenes)
@@ -428,6 +685,22 @@ def run_halloween_sequence() -> bool:
         except Exception as cleanup_error:
             logger.error(f"Error during emergency cleanup: {cleanup_error}")
 
+def request_shutdown(signum, frame) -> None:
+    """
+    Signal handler for SIGTERM and SIGINT.
+    
+    Wakes the main loop so it exits straight away instead of after the
+    current sensor interval. A sequence in progress is interrupted so the
+    emergency cleanup runs, as Ctrl+C always did.
+    
+    Args:
+        signum: Signal number
+        frame: Current stack frame
+    """
+    SHUTDOWN_EVENT.set()
+    if SEQUENCE_RUNNING:
+        raise KeyboardInterrupt
+
 def main():
     """
     Main Halloween coffin control loop with YAML configuration support.
@@ -441,24 +714,28 @@ def main():
         logger.error("Failed to initialize system. Exiting.")
         return 1
     
+    signal.signal(signal.SIGTERM, request_shutdown)
+    signal.signal(signal.SIGINT, request_shutdown)
+    
     try:
         # Get configuration values
-        distance_threshold_near = get_config_value('detection', 'distance_threshold_near', 50)
-        sensor_reading_interval = get_config_value('detection', 'sensor_reading_interval', 0.5)
-        cooldown_after_sequence = get_config_value('settings', 'cooldown_after_sequence', 30)
+        runtime_config = get_runtime_config()
+        distance_threshold_near = runtime_config.distance_threshold_near
+        sensor_reading_interval = runtime_config.sensor_reading_interval
+        cooldown_after_sequence = runtime_config.cooldown_after_sequence
         
         logger.info("System ready. Monitoring for movement...")
         logger.info(f"Detection threshold: {distance_threshold_near}cm")
         logger.info(f"Reading interval: {sensor_reading_interval}s")
         
-        last_sequence_time = 0
+        last_sequence_time = -float(cooldown_after_sequence)
         
-        while True:
+        while not SHUTDOWN_EVENT.is_set():
             distance = get_shortest_distance()
-            logger.debug(f"Distance: {distance:.1f} cm")
+            logger.debug("Distance: %.1f cm", distance)
             
             # Check if enough time has passed since last sequence
-            current_time = time.time()
+            current_time = time.monotonic()
             time_since_last_sequence = current_time - last_sequence_time
             
             # Only trigger effects when someone is close enough and cooldown has passed
@@ -472,9 +749,12 @@ def main():
                     logger.error("Halloween sequence failed")
             elif distance < distance_threshold_near and time_since_last_sequence < cooldown_after_sequence:
                 remaining_cooldown = cooldown_after_sequence - time_since_last_sequence
-                logger.debug(f"Person detected but cooldown active ({remaining_cooldown:.1f}s remaining)")
+                logger.debug("Person detected but cooldown active (%.1fs remaining)", remaining_cooldown)
             
-            sleep(sensor_reading_interval)
+            # Returns early when a shutdown signal arrives
+            SHUTDOWN_EVENT.wait(sensor_reading_interval)
+        
+        logger.info("Shutdown requested")
             
     except KeyboardInterrupt:
         logger.info("Shutdown requested by user")
@@ -485,6 +765,7 @@ def main():
         logger.info("Shutting down Halloween coffin system...")
         cleanup_hardware()
         logger.info("Shutdown complete")
+        stop_log_listener()
     
     return 0
 if __name__ == "__main__":
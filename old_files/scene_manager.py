@@ -7,16 +7,37 @@ This module handles loading and executing scenes from YAML configuration files.
 import yaml
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from pathlib import Path
 
+from yaml_cache import load_yaml
+
 logger = logging.getLogger(__name__)
 
+# Step log levels accepted in scenes.yaml; anything else logs at INFO
+STEP_LOG_FUNCTIONS = {
+    'DEBUG': logger.debug,
+    'INFO': logger.info,
+    'WARNING': logger.warning,
+    'ERROR': logger.error,
+}
+
 class SceneManager:
     """
     Manages Halloween coffin scenes from YAML configuration.
     """
     
+    # Scenes kept out of random selection
+    TEST_SCENES = frozenset({'maintenance_mode', 'emergency_test', 'quick_scare'})
+    
+    # Effect types in the order a step runs them, with the method handling each
+    EFFECT_HANDLERS = (
+        ('lights', 'execute_light_effect'),
+        ('audio', 'execute_audio_effect'),
+        ('motor', 'execute_motor_effect'),
+        ('relay', 'execute_relay_effect'),
+    )
+    
     def __init__(self, config_file: str = "scenes.yaml"):
         """
         Initialize the scene manager.
@@ -25,8 +46,17 @@ class SceneManager:
             config_file: Path to the YAML configuration file
         """
         self.config_file = Path(config_file)
+        self._config_path = str(self.config_file)
         self.config: Dict[str, Any] = {}
         self.hardware_refs: Dict[str, Any] = {}
+        self._lights: Any = None
+        self._motor: Any = None
+        self._audio_players: Dict[str, Any] = {}
+        self._relays: Dict[str, Any] = {}
+        self._scene_index: Dict[str, Dict[str, Any]] = {}
+        self._all_scenes: Dict[str, Dict[str, Any]] = {}
+        self._compiled_scenes: Dict[str, Tuple[Tuple, ...]] = {}
+        self._runtime_scene_names: Tuple[str, ...] = ()
         self.load_config()
     
     def load_config(self) -> bool:
@@ -37,21 +67,44 @@ class SceneManager:
             bool: True if loaded successfully, False otherwise
         """
         try:
-            if not self.config_file.exists():
-                logger.error(f"Configuration file not found: {self.config_file}")
-                return False
-            
-            with open(self.config_file, 'r') as file:
-                self.config = yaml.safe_load(file)
-            
-            logger.info(f"Configuration loaded from {self.config_file}")
+            # libyaml-backed and cached, see yaml_cache. Its stat() doubles as
+            # the existence check, so the file isn't stat'ed twice.
+            self.config = load_yaml(self._config_path)
+            
+            # Main scenes and alternative sequences merged once per load. On a
+            # name clash get_scene() finds the main scene, while get_all_scenes()
+            # lists the alternative, as they always have.
+            scenes = self.config.get('scenes', {})
+            alternative_scenes = self.config.get('alternative_sequences', {})
+            self._scene_index = dict(scenes)
+            for name, scene in alternative_scenes.items():
+                self._scene_index.setdefault(name, scene)
+            self._all_scenes = {**scenes, **alternative_scenes}
+            
+            # Steps are parsed here once rather than on every trigger, into
+            # tuples every run of the scene shares. A scene that fails to
+            # compile is left out, so the rest of the file still loads.
+            self._compiled_scenes = {}
+            for name, scene in self._scene_index.items():
+                try:
+                    self._compiled_scenes[name] = tuple(self._compile_step(step_config) for step_config in scene.get('steps', []))
+                except Exception as e:
+                    logger.error("Error compiling scene '%s', skipping it: %s", name, e)
+            
+            # Scene names only change on reload, so work them out here once
+            self._runtime_scene_names = tuple(self.get_scene_names(exclude_test_scenes=True))
+            
+            logger.info("Configuration loaded from %s", self.config_file)
             return True
             
+        except FileNotFoundError:
+            logger.error("Configuration file not found: %s", self.config_file)
+            return False
         except yaml.YAMLError as e:
-            logger.error(f"Error parsing YAML configuration: {e}")
+            logger.error("Error parsing YAML configuration: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             return False
     
     def set_hardware_references(self, hardware: Dict[str, Any]) -> None:
@@ -62,6 +115,12 @@ class SceneManager:
             hardware: Dictionary of hardware component references
         """
         self.hardware_refs = hardware
+        
+        # Resolve the references effects use once, rather than on every step
+        self._lights = hardware.get('lights')
+        self._motor = hardware.get('motor')
+        self._audio_players = {name[:-len('_sound')]: player for name, player in hardware.items() if name.endswith('_sound')}
+        self._relays = {name[:-len('_relay')]: relay for name, relay in hardware.items() if name.endswith('_relay')}
         logger.debug("Hardware references set")
     
     def get_scene(self, scene_name: str) -> Optional[Dict[str, Any]]:
@@ -74,17 +133,7 @@ class SceneManager:
         Returns:
             Scene configuration or None if not found
         """
-        # Check main scenes first
-        scenes = self.config.get('scenes', {})
-        if scene_name in scenes:
-            return scenes[scene_name]
-        
-        # Check alternative sequences
-        alternative_scenes = self.config.get('alternative_sequences', {})
-        if scene_name in alternative_scenes:
-            return alternative_scenes[scene_name]
-        
-        return None
+        return self._scene_index.get(scene_name)
     
     def get_all_scenes(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -93,17 +142,7 @@ class SceneManager:
         Returns:
             Dictionary of all scene configurations
         """
-        all_scenes = {}
-        
-        # Add main scenes
-        main_scenes = self.config.get('scenes', {})
-        all_scenes.update(main_scenes)
-        
-        # Add alternative scenes
-        alternative_scenes = self.config.get('alternative_sequences', {})
-        all_scenes.update(alternative_scenes)
-        
-        return all_scenes
+        return dict(self._all_scenes)
     
     def get_scene_names(self, exclude_test_scenes: bool = True) -> List[str]:
         """
@@ -115,14 +154,22 @@ class SceneManager:
         Returns:
             List of scene names
         """
-        all_scenes = self.get_all_scenes()
-        scene_names = list(all_scenes.keys())
-        
         if exclude_test_scenes:
-            test_scenes = {'maintenance_mode', 'emergency_test', 'quick_scare'}
-            scene_names = [name for name in scene_names if name not in test_scenes]
+            return [name for name in self._scene_index if name not in self.TEST_SCENES]
+        
+        return list(self._scene_index)
+    
+    def get_runtime_scene_names(self) -> Tuple[str, ...]:
+        """
+        Get the scene names available for random selection.
+        
+        The tuple is built when the configuration is loaded, so this is
+        cheap enough to call on every trigger.
         
-        return scene_names
+        Returns:
+            Tuple of scene names, excluding test/maintenance scenes
+        """
+        return self._runtime_scene_names
     
     def get_hardware_config(self) -> Dict[str, Any]:
         """
@@ -153,6 +200,44 @@ class SceneManager:
         """
         return self.config.get('settings', {})
     
+    def _compile_step(self, step_config: Dict[str, Any]) -> Tuple:
+        """
+        Resolve a step's YAML into what executing it needs.
+        
+        Args:
+            step_config: Step configuration dictionary
+            
+        Returns:
+            Tuple of (step number, log function, log message, duration,
+            effect calls), where effect calls are (handler, config) pairs
+        """
+        step_num = step_config.get('step', 'unknown')
+        step_name = step_config.get('name', f'Step {step_num}')
+        duration = step_config.get('duration', 0)
+        logging_config = step_config.get('logging', {})
+        
+        log_level = logging_config.get('level', 'info').upper()
+        log_function = STEP_LOG_FUNCTIONS.get(log_level, logger.info)
+        log_message = logging_config.get('message', f'Executing {step_name}')
+        
+        return (step_num, log_function, log_message, duration, self._compile_effects(step_config.get('effects', {})))
+    
+    def _compile_effects(self, effects: Dict[str, Any]) -> Tuple[Tuple[Callable[[Dict[str, Any]], bool], Dict[str, Any]], ...]:
+        """
+        Pair each effect in a step with the method that executes it.
+        
+        Args:
+            effects: Effects configuration dictionary
+            
+        Returns:
+            Tuple of (handler, config) pairs, in execution order
+        """
+        return tuple(
+            (getattr(self, handler_name), effects[effect_type])
+            for effect_type, handler_name in self.EFFECT_HANDLERS
+            if effect_type in effects
+        )
+    
     def execute_scene(self, scene_name: str) -> bool:
         """
         Execute a complete scene sequence.
@@ -165,28 +250,31 @@ class SceneManager:
         """
         scene = self.get_scene(scene_name)
         if not scene:
-            logger.error(f"Scene '{scene_name}' not found")
+            logger.error("Scene '%s' not found", scene_name)
             return False
         
-        logger.info(f"Executing scene: {scene.get('name', scene_name)}")
-        logger.info(f"Description: {scene.get('description', 'No description')}")
+        logger.info("Executing scene: %s", scene.get('name', scene_name))
+        logger.info("Description: %s", scene.get('description', 'No description'))
         
-        steps = scene.get('steps', [])
+        steps = self._compiled_scenes.get(scene_name)
+        if steps is None:
+            logger.error("Scene '%s' failed to compile and cannot be executed", scene_name)
+            return False
         if not steps:
-            logger.warning(f"No steps defined for scene '{scene_name}'")
+            logger.warning("No steps defined for scene '%s'", scene_name)
             return True
         
         try:
-            for step_config in steps:
-                if not self.execute_step(step_config):
-                    logger.error(f"Failed to execute step {step_config.get('step', 'unknown')}")
+            for step in steps:
+                if not self._run_step(step):
+                    logger.error("Failed to execute step %s", step[0])
                     return False
             
-            logger.info(f"Scene '{scene_name}' completed successfully")
+            logger.info("Scene '%s' completed successfully", scene_name)
             return True
             
         except Exception as e:
-            logger.error(f"Error executing scene '{scene_name}': {e}")
+            logger.error("Error executing scene '%s': %s", scene_name, e)
             return False
     
     def execute_step(self, step_config: Dict[str, Any]) -> bool:
@@ -199,29 +287,27 @@ class SceneManager:
         Returns:
             bool: True if step executed successfully, False otherwise
         """
-        step_num = step_config.get('step', 'unknown')
-        step_name = step_config.get('name', f'Step {step_num}')
-        duration = step_config.get('duration', 0)
-        effects = step_config.get('effects', {})
-        logging_config = step_config.get('logging', {})
+        return self._run_step(self._compile_step(step_config))
+    
+    def _run_step(self, step: Tuple) -> bool:
+        """
+        Execute a step produced by _compile_step().
         
-        # Log step start
-        log_level = logging_config.get('level', 'info').upper()
-        log_message = logging_config.get('message', f'Executing {step_name}')
+        Args:
+            step: Compiled step
+            
+        Returns:
+            bool: True if step executed successfully, False otherwise
+        """
+        step_num, log_function, log_message, duration, effect_calls = step
         
-        if log_level == 'DEBUG':
-            logger.debug(log_message)
-        elif log_level == 'WARNING':
-            logger.warning(log_message)
-        elif log_level == 'ERROR':
-            logger.error(log_message)
-        else:
-            logger.info(log_message)
+        # Log step start
+        log_function(log_message)
         
         try:
             # Execute effects
-            if not self.execute_effects(effects):
-                logger.error(f"Failed to execute effects for step {step_num}")
+            if not self._run_effects(effect_calls):
+                logger.error("Failed to execute effects for step %s", step_num)
                 return False
             
             # Wait for step duration
@@ -231,7 +317,7 @@ class SceneManager:
             return True
             
         except Exception as e:
-            logger.error(f"Error executing step {step_num}: {e}")
+            logger.error("Error executing step %s: %s", step_num, e)
             return False
     
     def execute_effects(self, effects: Dict[str, Any]) -> bool:
@@ -244,28 +330,24 @@ class SceneManager:
         Returns:
             bool: True if all effects executed successfully, False otherwise
         """
-        success = True
-        
-        # Handle lights
-        if 'lights' in effects:
-            if not self.execute_light_effect(effects['lights']):
-                success = False
-        
-        # Handle audio
-        if 'audio' in effects:
-            if not self.execute_audio_effect(effects['audio']):
-                success = False
+        return self._run_effects(self._compile_effects(effects))
+    
+    def _run_effects(self, effect_calls: Tuple) -> bool:
+        """
+        Execute effects produced by _compile_effects().
         
-        # Handle motor
-        if 'motor' in effects:
-            if not self.execute_motor_effect(effects['motor']):
-                success = False
+        Every effect runs even if an earlier one fails.
         
-        # Handle relay
-        if 'relay' in effects:
-            if not self.execute_relay_effect(effects['relay']):
+        Args:
+            effect_calls: Tuple of (handler, config) pairs
+            
+        Returns:
+            bool: True if all effects executed successfully, False otherwise
+        """
+        success = True
+        for handler, effect_config in effect_calls:
+            if not handler(effect_config):
                 success = False
-        
         return success
     
     def execute_light_effect(self, light_config: Dict[str, Any]) -> bool:
@@ -279,7 +361,7 @@ class SceneManager:
             bool: True if effect executed successfully, False otherwise
         """
         try:
-            lights = self.hardware_refs.get('lights')
+            lights = self._lights
             if not lights:
                 logger.error("Lights hardware reference not available")
                 return False
@@ -312,7 +394,7 @@ class SceneManager:
             return True
             
         except Exception as e:
-            logger.error(f"Error executing light effect: {e}")
+            logger.error("Error executing light effect: %s", e)
             return False
     
     def execute_audio_effect(self, audio_config: Dict[str, Any]) -> bool:
@@ -333,16 +415,16 @@ class SceneManager:
                 logger.error("Audio file not specified")
                 return False
             
-            # Get audio player based on file name
-            audio_players = {
-                'opening': self.hardware_refs.get('opening_sound'),
-                'creepy': self.hardware_refs.get('creepy_sound'),
-                'thump': self.hardware_refs.get('thump_sound')
-            }
+            # YAML can hand over a string or boolean here; MP3Player takes
+            # anything float() accepts, so check the type at this boundary
+            if isinstance(volume, bool) or not isinstance(volume, (int, float)):
+                logger.error("Invalid volume for '%s': %r", file_name, volume)
+                return False
             
-            player = audio_players.get(file_name)
+            # Get audio player based on file name
+            player = self._audio_players.get(file_name)
             if not player:
-                logger.error(f"Audio player for '{file_name}' not available")
+                logger.error("Audio player for '%s' not available", file_name)
                 return False
             
             # Set volume and play
@@ -350,7 +432,7 @@ class SceneManager:
             return player.play()
             
         except Exception as e:
-            logger.error(f"Error executing audio effect: {e}")
+            logger.error("Error executing audio effect: %s", e)
             return False
     
     def execute_motor_effect(self, motor_config: Dict[str, Any]) -> bool:
@@ -364,7 +446,7 @@ class SceneManager:
             bool: True if effect executed successfully, False otherwise
         """
         try:
-            motor = self.hardware_refs.get('motor')
+            motor = self._motor
             if not motor:
                 logger.error("Motor hardware reference not available")
                 return False
@@ -377,11 +459,11 @@ class SceneManager:
             elif action == 'close':
                 return motor.move_reverse(duration)
             else:
-                logger.error(f"Unknown motor action: {action}")
+                logger.error("Unknown motor action: %s", action)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error executing motor effect: {e}")
+            logger.error("Error executing motor effect: %s", e)
             return False
     
     def execute_relay_effect(self, relay_config: Dict[str, Any]) -> bool:
@@ -404,34 +486,25 @@ class SceneManager:
                 return False
             
             # Get relay based on name
-            relay = self.hardware_refs.get(f'{relay_name}_relay')
+            relay = self._relays.get(relay_name)
             if not relay:
-                logger.error(f"Relay '{relay_name}' not available")
+                logger.error("Relay '%s' not available", relay_name)
                 return False
             
-            # Execute relay action
-            if action == 'on':
-                success = relay.on()
+            # Execute relay action; timed operations are turned off by the
+            # relay plugin's shared timer thread
+            if action == 'on' and duration > 0:
+                return relay.timed_on(duration)
+            elif action == 'on':
+                return relay.on()
             elif action == 'off':
-                success = relay.off()
+                return relay.off()
             else:
-                logger.error(f"Unknown relay action: {action}")
+                logger.error("Unknown relay action: %s", action)
                 return False
             
-            # Handle timed relay operations
-            if duration > 0 and action == 'on':
-                def timed_off():
-                    time.sleep(duration)
-                    relay.off()
-                
-                import threading
-                timer_thread = threading.Thread(target=timed_off, daemon=True)
-                timer_thread.start()
-            
-            return success
-            
         except Exception as e:
-            logger.error(f"Error executing relay effect: {e}")
+            logger.error("Error executing relay effect: %s", e)
             return False
     
     def get_emergency_cleanup_actions(self) -> List[Dict[str, Any]]:
@@ -455,17 +528,17 @@ class SceneManager:
                 target = action.get('target')
                 
                 if action_type == 'relay_off':
-                    relay = self.hardware_refs.get(f'{target}_relay')
+                    relay = self._relays.get(target)
                     if relay:
                         relay.off()
                 elif action_type == 'motor_close':
-                    motor = self.hardware_refs.get('motor')
+                    motor = self._motor
                     if motor:
                         motor.move_reverse(6.0)
                 elif action_type == 'lights_off':
-                    lights = self.hardware_refs.get('lights')
+                    lights = self._lights
                     if lights:
                         lights.turn_off()
                         
             except Exception as e:
-                logger.error(f"Error in emergency cleanup action {action}: {e}")
+                logger.error("Error in emergency cleanup action %s: %s", action, e)
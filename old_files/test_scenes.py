@@ -5,35 +5,92 @@ Can also test specific scenes by passing a scene name as an argument.
 """
 
 import sys
+import random
 import logging
 import argparse
-from scene_manager import SceneManager
+import functools
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Imported where it's used, so --help doesn't pay for PyYAML
+    from scene_manager import SceneManager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+def setup_logging() -> None:
+    """Configure logging for a test run."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+@functools.lru_cache(maxsize=1)
+def load_scene_manager(config_file: str = "scenes.yaml") -> Optional["SceneManager"]:
+    """
+    Load the scene configuration once and share it between the tests.
+    
+    The tests only read the configuration, so one SceneManager serves
+    them all instead of each loading its own.
+    
+    Args:
+        config_file: Path to the YAML configuration file
+        
+    Returns:
+        Loaded SceneManager, or None if the configuration failed to load
+    """
+    from scene_manager import SceneManager
+    
+    scene_manager = SceneManager(config_file)
+    if not scene_manager.config:
+        return None
+    return scene_manager
+
+def print_step_effects(effects: dict, indent: str) -> None:
+    """
+    Print one line per effect in a step.
+    
+    Args:
+        effects: Effects configuration dictionary
+        indent: Leading whitespace for each line
+    """
+    # Each effect's config is looked up once
+    lights = effects.get('lights')
+    audio = effects.get('audio')
+    motor = effects.get('motor')
+    relay = effects.get('relay')
+    
+    if lights is not None:
+        color = lights.get('color', [0, 0, 0])
+        flash = lights.get('flash', False)
+        print(f"{indent}💡 Lights: RGB{color} {'(flash)' if flash else ''}")
+    
+    if audio is not None:
+        print(f"{indent}🔊 Audio: {audio.get('file', 'unknown')} (vol: {audio.get('volume', 0.5)})")
+    
+    if motor is not None:
+        print(f"{indent}🚪 Motor: {motor.get('action', 'unknown')} ({motor.get('duration', 0)}s)")
+    
+    if relay is not None:
+        print(f"{indent}⚡ Relay {relay.get('name', 'unknown')}: {relay.get('action', 'unknown')}")
+
 def test_scene_selection():
     """Test the random scene selection functionality."""
     try:
         # Initialize scene manager
-        scene_manager = SceneManager("scenes.yaml")
-        if not scene_manager.load_config():
+        scene_manager = load_scene_manager()
+        if not scene_manager:
             logger.error("Failed to load configuration")
             return False
         
         print("🎃 Testing Random Scene Selection 🎃")
         print("=" * 50)
         
-        # Get all available scenes
-        all_scenes = scene_manager.get_all_scenes()
-        available_for_random = scene_manager.get_scene_names(exclude_test_scenes=True)
+        # The random pool is the tuple load_config already built; no second filter pass
+        total_scenes = len(scene_manager.get_scene_names(exclude_test_scenes=False))
+        available_for_random = scene_manager.get_runtime_scene_names()
         
         print(f"\n📊 Scene Statistics:")
-        print(f"  Total scenes: {len(all_scenes)}")
+        print(f"  Total scenes: {total_scenes}")
         print(f"  Available for random: {len(available_for_random)}")
         
         print(f"\n🎭 Available Scenes for Random Selection:")
@@ -45,12 +102,12 @@ def test_scene_selection():
         print(f"\n🎲 Random Scene Selection Test:")
         print("  Running 10 random selections...")
         
-        for i in range(10):
-            import random
-            selected_scene = random.choice(available_for_random)
+        # All ten picks in one call, with replacement like repeated choice()
+        selections = random.choices(available_for_random, k=10)
+        for i, selected_scene in enumerate(selections, 1):
             scene_config = scene_manager.get_scene(selected_scene)
             scene_name = scene_config.get('name', selected_scene) if scene_config else selected_scene
-            print(f"    {i+1:2d}. {selected_scene} - {scene_name}")
+            print(f"    {i:2d}. {selected_scene} - {scene_name}")
         
         print(f"\n✅ Random scene selection test completed successfully!")
         return True
@@ -62,8 +119,8 @@ def test_scene_selection():
 def test_scene_execution():
     """Test scene execution (dry run)."""
     try:
-        scene_manager = SceneManager("scenes.yaml")
-        if not scene_manager.load_config():
+        scene_manager = load_scene_manager()
+        if not scene_manager:
             logger.error("Failed to load configuration")
             return False
         
@@ -90,25 +147,7 @@ def test_scene_execution():
                 print(f"      • {step_name} ({duration}s)")
                 
                 # Show effects
-                if 'lights' in effects:
-                    color = effects['lights'].get('color', [0, 0, 0])
-                    flash = effects['lights'].get('flash', False)
-                    print(f"        💡 Lights: RGB{color} {'(flash)' if flash else ''}")
-                
-                if 'audio' in effects:
-                    file_name = effects['audio'].get('file', 'unknown')
-                    volume = effects['audio'].get('volume', 0.5)
-                    print(f"        🔊 Audio: {file_name} (vol: {volume})")
-                
-                if 'motor' in effects:
-                    action = effects['motor'].get('action', 'unknown')
-                    duration = effects['motor'].get('duration', 0)
-                    print(f"        🚪 Motor: {action} ({duration}s)")
-                
-                if 'relay' in effects:
-                    relay_name = effects['relay'].get('name', 'unknown')
-                    action = effects['relay'].get('action', 'unknown')
-                    print(f"        ⚡ Relay {relay_name}: {action}")
+                print_step_effects(effects, "        ")
         
         print(f"\n✅ Scene execution test completed successfully!")
         return True
@@ -120,8 +159,8 @@ def test_scene_execution():
 def test_specific_scene(scene_name: str):
     """Test a specific scene execution (dry run)."""
     try:
-        scene_manager = SceneManager("scenes.yaml")
-        if not scene_manager.load_config():
+        scene_manager = load_scene_manager()
+        if not scene_manager:
             logger.error("Failed to load configuration")
             return False
         
@@ -160,25 +199,7 @@ def test_specific_scene(scene_name: str):
             effects = step.get('effects', {})
             
             # Show effects
-            if 'lights' in effects:
-                color = effects['lights'].get('color', [0, 0, 0])
-                flash = effects['lights'].get('flash', False)
-                print(f"     💡 Lights: RGB{color} {'(flash)' if flash else ''}")
-            
-            if 'audio' in effects:
-                file_name = effects['audio'].get('file', 'unknown')
-                volume = effects['audio'].get('volume', 0.5)
-                print(f"     🔊 Audio: {file_name} (vol: {volume})")
-            
-            if 'motor' in effects:
-                action = effects['motor'].get('action', 'unknown')
-                duration = effects['motor'].get('duration', 0)
-                print(f"     🚪 Motor: {action} ({duration}s)")
-            
-            if 'relay' in effects:
-                relay_name = effects['relay'].get('name', 'unknown')
-                action = effects['relay'].get('action', 'unknown')
-                print(f"     ⚡ Relay {relay_name}: {action}")
+            print_step_effects(effects, "     ")
         
         print(f"\n⏱️  Total Duration: {total_duration}s")
         print(f"✅ Scene '{scene_name}' test completed successfully!")
@@ -208,6 +229,7 @@ Examples:
     )
     
     args = parser.parse_args()
+    setup_logging()
     
     # If a specific scene is provided, test only that scene
     if args.scene:
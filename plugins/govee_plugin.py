@@ -2,6 +2,7 @@ import socket
 import json
 import time
 import logging
+from threading import Event
 from typing import Dict, Any, Optional, Tuple
 
 class GoveeLight:
@@ -18,6 +19,13 @@ class GoveeLight:
     FLASH_DELAY = 0.3
     MAX_COLOR_VALUE = 255
     MIN_COLOR_VALUE = 0
+    SEND_BUFFER_SIZE = 65536  # bytes
+    STATE_CACHE_TTL = 5.0  # seconds the last sent power state is trusted
+    
+    # Pre-encoded command payloads, so turn_on/turn_off/flash skip json.dumps
+    TURN_ON_PAYLOAD = b'{"msg":{"cmd":"turn","data":{"value":1}}}'
+    TURN_OFF_PAYLOAD = b'{"msg":{"cmd":"turn","data":{"value":0}}}'
+    COLOR_PAYLOAD_TEMPLATE = b'{"msg":{"cmd":"colorwc","data":{"color":{"r":%d,"g":%d,"b":%d}}}}'
     
     def __init__(self, ip_address: str, port: int = DEFAULT_PORT) -> None:
         """
@@ -29,8 +37,28 @@ class GoveeLight:
         """
         self.ip_address = ip_address
         self.port = port
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.logger = logging.getLogger(__name__)
+        self._address = (ip_address, port)
+        self._stop_flash_event = Event()  # Set by stop_flash() to end a flash early
+        self._is_on: Optional[bool] = None  # Last power state sent; None until known
+        self._is_on_at = float('-inf')  # monotonic time _is_on was last sent
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        
+        # Commands are best-effort; never stall a scene waiting on the send queue
+        self.socket.setblocking(False)
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER_SIZE)
+        except OSError as e:
+            self.logger.warning("Could not set UDP send buffer size: %s", e)
+        
+        # Fix the destination once so each command is a plain send()
+        try:
+            self.socket.connect(self._address)
+            self._connected = True
+        except OSError as e:
+            # e.g. network not up yet at boot; fall back to addressing each send
+            self.logger.warning("Could not connect UDP socket to %s:%d: %s", ip_address, port, e)
+            self._connected = False
 
     def send_command(self, command: Dict[str, Any]) -> bool:
         """
@@ -43,16 +71,53 @@ class GoveeLight:
             bool: True if command was sent successfully, False otherwise
         """
         try:
-            command_json = json.dumps(command)
-            self.socket.sendto(command_json.encode(), (self.ip_address, self.port))
-            self.logger.debug(f"Sent command: {command_json}")
+            return self._send_payload(json.dumps(command).encode())
+        except Exception as e:
+            self.logger.error("Unexpected error encoding command: %s", e)
+            return False
+
+    def _send_payload(self, payload: bytes) -> bool:
+        """
+        Send an already encoded command to the Govee light device.
+        
+        Args:
+            payload: JSON command as bytes
+            
+        Returns:
+            bool: True if command was sent successfully, False otherwise
+        """
+        try:
+            if self._connected:
+                try:
+                    self.socket.send(payload)
+                except ConnectionRefusedError:
+                    # A connected UDP socket reports an ICMP port unreachable
+                    # for an earlier packet on the next send, which is then
+                    # not sent itself; send it again
+                    self.socket.send(payload)
+            else:
+                self.socket.sendto(payload, self._address)
+            self.logger.debug("Sent command: %s", payload)
             return True
+        except BlockingIOError:
+            self.logger.warning("UDP send buffer full, command dropped")
         except socket.error as e:
-            self.logger.error(f"Failed to send command: {e}")
-            return False
+            self.logger.error("Failed to send command: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error sending command: {e}")
-            return False  
+            self.logger.error("Unexpected error sending command: %s", e)
+        # A dropped command leaves the light's power state unknown
+        self._is_on = None
+        return False
+
+    def _set_power_state(self, is_on: bool) -> None:
+        """
+        Record a power state that was just sent to the light.
+        
+        Args:
+            is_on: True if the light was turned on, False if off
+        """
+        self._is_on = is_on
+        self._is_on_at = time.monotonic()
 
     def turn_on(self) -> bool:
         """
@@ -61,15 +126,10 @@ class GoveeLight:
         Returns:
             bool: True if command was sent successfully, False otherwise
         """
-        command = {
-            "msg": {
-                "cmd": "turn",
-                "data": {
-                    "value": 1
-                }
-            }
-        }
-        return self.send_command(command)
+        if not self._send_payload(self.TURN_ON_PAYLOAD):
+            return False
+        self._set_power_state(True)
+        return True
 
     def turn_off(self) -> bool:
         """
@@ -78,15 +138,10 @@ class GoveeLight:
         Returns:
             bool: True if command was sent successfully, False otherwise
         """
-        command = {
-            "msg": {
-                "cmd": "turn",
-                "data": {
-                    "value": 0
-                }
-            }
-        }
-        return self.send_command(command)
+        if not self._send_payload(self.TURN_OFF_PAYLOAD):
+            return False
+        self._set_power_state(False)
+        return True
 
     def set_color(self, red: int, green: int, blue: int, color_temp: int = DEFAULT_COLOR_TEMP) -> bool:
         """
@@ -101,24 +156,43 @@ class GoveeLight:
         Returns:
             bool: True if command was sent successfully, False otherwise
         """
+        # The payload template takes integers; round rather than let %d truncate
+        try:
+            rgb = (int(round(red)), int(round(green)), int(round(blue)))
+        except (TypeError, ValueError, OverflowError):
+            self.logger.error("Invalid color values: R=%r, G=%r, B=%r. Values must be numbers", red, green, blue)
+            return False
+        
         # Validate color values
-        if not self._validate_color_value(red) or not self._validate_color_value(green) or not self._validate_color_value(blue):
-            self.logger.error(f"Invalid color values: R={red}, G={green}, B={blue}. Values must be between {self.MIN_COLOR_VALUE} and {self.MAX_COLOR_VALUE}")
+        if not all(self._validate_color_value(value) for value in rgb):
+            self.logger.error("Invalid color values: R=%s, G=%s, B=%s. Values must be between %d and %d",
+                              red, green, blue, self.MIN_COLOR_VALUE, self.MAX_COLOR_VALUE)
             return False
         
-        command = {
-            "msg": {
-                "cmd": "colorwc",
-                "data": {
-                    "color": {
-                        "r": red,
-                        "g": green,
-                        "b": blue
-                    }
-                }
-            }
-        }
-        return self.send_command(command)
+        return self._send_payload(self.COLOR_PAYLOAD_TEMPLATE % rgb)
+
+    def set_on_and_color(self, red: int, green: int, blue: int) -> bool:
+        """
+        Make sure the light is on and set its color.
+        
+        The turn-on command is skipped when this controller turned the light
+        on within the last STATE_CACHE_TTL seconds, so repeated color changes
+        cost a single packet each. UDP gives no acknowledgement, so after that
+        (or after a failed send) the light is turned on again in case it was
+        switched off elsewhere or lost the packet.
+        
+        Args:
+            red: Red component (0-255)
+            green: Green component (0-255)
+            blue: Blue component (0-255)
+            
+        Returns:
+            bool: True if all commands were sent successfully, False otherwise
+        """
+        state_is_fresh = time.monotonic() - self._is_on_at < self.STATE_CACHE_TTL
+        if not (self._is_on and state_is_fresh) and not self.turn_on():
+            return False
+        return self.set_color(red, green, blue)
 
     def flash(self, amount: int = 10, delay: float = FLASH_DELAY) -> bool:
         """
@@ -135,24 +209,40 @@ class GoveeLight:
             self.logger.warning("Flash amount must be positive")
             return False
         
+        self._stop_flash_event.clear()
         success = True
-        for i in range(amount):
+        payloads = (self.TURN_OFF_PAYLOAD, self.TURN_ON_PAYLOAD)
+        start_time = time.monotonic()
+        for step in range(2 * amount):
             try:
-                if not self.turn_off():
+                if self._send_payload(payloads[step & 1]):
+                    self._set_power_state(bool(step & 1))
+                else:
                     success = False
-                time.sleep(delay)
-                if not self.turn_on():
-                    success = False
-                time.sleep(delay)
+                # Wait for an absolute deadline so send time doesn't add up as drift
+                remaining = start_time + (step + 1) * delay - time.monotonic()
+                if self._stop_flash_event.wait(max(0.0, remaining)):
+                    break
             except KeyboardInterrupt:
                 self.logger.info("Flash interrupted by user")
                 break
             except Exception as e:
-                self.logger.error(f"Error during flash cycle {i+1}: {e}")
+                self.logger.error("Error during flash cycle %d: %s", step // 2 + 1, e)
                 success = False
         
+        if self._stop_flash_event.is_set():
+            # Don't leave the light dark if the flash was cut short while off
+            self.turn_on()
+            self.logger.info("Flash stopped early")
+        
         return success
     
+    def stop_flash(self) -> None:
+        """
+        Stop a flash running in another thread at its next on/off transition.
+        """
+        self._stop_flash_event.set()
+    
     def _validate_color_value(self, value: int) -> bool:
         """
         Validate that a color value is within the valid range.
@@ -173,7 +263,7 @@ class GoveeLight:
             self.socket.close()
             self.logger.debug("Socket connection closed")
         except Exception as e:
-            self.logger.error(f"Error closing socket: {e}")
+            self.logger.error("Error closing socket: %s", e)
     
     def __enter__(self):
         """
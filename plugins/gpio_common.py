@@ -0,0 +1,28 @@
+import RPi.GPIO as GPIO
+import atexit
+import threading
+
+# Valid BCM pin numbers (excluding reserved pins)
+VALID_BCM_PINS = frozenset(range(2, 28))
+
+# Pin numbering is process-wide, so it only needs setting once for all plugins
+_mode_lock = threading.Lock()
+_bcm_mode_set = False
+
+def ensure_bcm_mode() -> None:
+    """
+    Select BCM pin numbering the first time any plugin sets up a pin.
+
+    Also registers GPIO.cleanup() to run at exit, so every channel the
+    plugins set up is released even if a caller never cleans up. Safe to
+    call from several threads; later calls return without touching
+    RPi.GPIO.
+    """
+    global _bcm_mode_set
+    if _bcm_mode_set:
+        return
+    with _mode_lock:
+        if not _bcm_mode_set:
+            GPIO.setmode(GPIO.BCM)
+            atexit.register(GPIO.cleanup)
+            _bcm_mode_set = True
@@ -1,6 +1,7 @@
 import RPi.GPIO as GPIO
-import time
+from plugins.gpio_common import VALID_BCM_PINS, ensure_bcm_mode
 import logging
+from threading import Event
 from typing import Optional
 
 class Motor:
@@ -21,6 +22,7 @@ class Motor:
     MIN_DURATION = 0.1  # Minimum movement duration in seconds
     MAX_DURATION = 60.0  # Maximum movement duration in seconds
     DEFAULT_DURATION = 2.0  # Default movement duration in seconds
+    VALID_PINS = VALID_BCM_PINS  # Valid BCM pin numbers (excluding reserved pins)
     
     def __init__(self, forward_pin: int, reverse_pin: int) -> None:
         """
@@ -38,6 +40,13 @@ class Motor:
         self.reverse_pin = reverse_pin
         self.logger = logging.getLogger(__name__)
         self._is_initialized = False
+        self._stop_event = Event()  # Set by stop() to cut a timed movement short
+        
+        # Channel orders for the combined writes; the pin being switched off
+        # always comes first so both directions are never driven together
+        self._pins = (forward_pin, reverse_pin)
+        self._forward_pins = (reverse_pin, forward_pin)
+        self._reverse_pins = (forward_pin, reverse_pin)
         
         # Validate pin numbers
         if not self._validate_pin(forward_pin) or not self._validate_pin(reverse_pin):
@@ -48,7 +57,7 @@ class Motor:
         
         try:
             # Set up GPIO
-            GPIO.setmode(GPIO.BCM)
+            ensure_bcm_mode()
             GPIO.setup(self.forward_pin, GPIO.OUT)
             GPIO.setup(self.reverse_pin, GPIO.OUT)
             
@@ -56,19 +65,18 @@ class Motor:
             self._stop_motor()
             self._is_initialized = True
             
-            self.logger.info(f"Motor initialized - Forward: GPIO {forward_pin}, Reverse: GPIO {reverse_pin}")
+            self.logger.info("Motor initialized - Forward: GPIO %d, Reverse: GPIO %d", forward_pin, reverse_pin)
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize motor: {e}")
+            self.logger.error("Failed to initialize motor: %s", e)
             raise RuntimeError(f"GPIO setup failed: {e}")
     
     def _stop_motor(self) -> None:
         """Stop the motor by turning off both forward and reverse pins."""
         try:
-            GPIO.output(self.forward_pin, GPIO.LOW)
-            GPIO.output(self.reverse_pin, GPIO.LOW)
+            GPIO.output(self._pins, (GPIO.LOW, GPIO.LOW))
         except Exception as e:
-            self.logger.error(f"Error stopping motor: {e}")
+            self.logger.error("Error stopping motor: %s", e)
     
     def _validate_pin(self, pin: int) -> bool:
         """
@@ -80,9 +88,7 @@ class Motor:
         Returns:
             bool: True if pin is valid, False otherwise
         """
-        # Valid BCM pin numbers (excluding reserved pins)
-        valid_pins = [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27]
-        return pin in valid_pins
+        return pin in self.VALID_PINS
     
     def _validate_duration(self, duration: float) -> bool:
         """
@@ -96,6 +102,18 @@ class Motor:
         """
         return self.MIN_DURATION <= duration <= self.MAX_DURATION
     
+    def _wait(self, duration: float) -> bool:
+        """
+        Wait for a movement to run its course, returning early if stop() is called.
+        
+        Args:
+            duration: Duration to wait in seconds
+            
+        Returns:
+            bool: True if the wait completed, False if the movement was stopped
+        """
+        return not self._stop_event.wait(duration)
+    
     def move_forward(self, duration: float = DEFAULT_DURATION) -> bool:
         """
         Move motor forward for specified duration.
@@ -118,15 +136,19 @@ class Motor:
             raise ValueError(f"Duration must be between {self.MIN_DURATION} and {self.MAX_DURATION} seconds")
         
         try:
-            self.logger.info(f"Moving forward for {duration} seconds...")
-            GPIO.output(self.reverse_pin, GPIO.LOW)  # Ensure reverse is off
-            GPIO.output(self.forward_pin, GPIO.HIGH)  # Turn on forward
-            time.sleep(duration)
+            self.logger.info("Moving forward for %s seconds...", duration)
+            self._stop_event.clear()
+            # Reverse off, then forward on, in one call into RPi.GPIO
+            GPIO.output(self._forward_pins, (GPIO.LOW, GPIO.HIGH))
+            completed = self._wait(duration)
             GPIO.output(self.forward_pin, GPIO.LOW)  # Stop motor
+            if not completed:
+                self.logger.info("Forward movement stopped early")
+                return False
             self.logger.info("Forward movement complete")
             return True
         except Exception as e:
-            self.logger.error(f"Error during forward movement: {e}")
+            self.logger.error("Error during forward movement: %s", e)
             self._stop_motor()  # Ensure motor stops on error
             return False
     
@@ -152,31 +174,36 @@ class Motor:
             raise ValueError(f"Duration must be between {self.MIN_DURATION} and {self.MAX_DURATION} seconds")
         
         try:
-            self.logger.info(f"Moving reverse for {duration} seconds...")
-            GPIO.output(self.forward_pin, GPIO.LOW)  # Ensure forward is off
-            GPIO.output(self.reverse_pin, GPIO.HIGH)  # Turn on reverse
-            time.sleep(duration)
+            self.logger.info("Moving reverse for %s seconds...", duration)
+            self._stop_event.clear()
+            # Forward off, then reverse on, in one call into RPi.GPIO
+            GPIO.output(self._reverse_pins, (GPIO.LOW, GPIO.HIGH))
+            completed = self._wait(duration)
             GPIO.output(self.reverse_pin, GPIO.LOW)  # Stop motor
+            if not completed:
+                self.logger.info("Reverse movement stopped early")
+                return False
             self.logger.info("Reverse movement complete")
             return True
         except Exception as e:
-            self.logger.error(f"Error during reverse movement: {e}")
+            self.logger.error("Error during reverse movement: %s", e)
             self._stop_motor()  # Ensure motor stops on error
             return False
     
     def stop(self) -> bool:
         """
-        Stop the motor immediately.
+        Stop the motor immediately, cutting short any timed movement.
         
         Returns:
             bool: True if motor stopped successfully, False otherwise
         """
         try:
             self.logger.info("Stopping motor...")
+            self._stop_event.set()
             self._stop_motor()
             return True
         except Exception as e:
-            self.logger.error(f"Error stopping motor: {e}")
+            self.logger.error("Error stopping motor: %s", e)
             return False
     
     def cleanup(self) -> None:
@@ -187,11 +214,12 @@ class Motor:
         to ensure proper GPIO cleanup.
         """
         try:
+            self._stop_event.set()
             self._stop_motor()
             self._is_initialized = False
-            self.logger.info(f"Motor on GPIO {self.forward_pin}/{self.reverse_pin} cleaned up")
+            self.logger.info("Motor on GPIO %d/%d cleaned up", self.forward_pin, self.reverse_pin)
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
     
     def __enter__(self):
         """
@@ -6,12 +6,43 @@ import logging
 from typing import Optional, Tuple, Union
 from pathlib import Path
 
+# The mixer is shared by every MP3Player in the process
+_mixer_lock = threading.Lock()
+_mixer_device: Optional[str] = None
+_mixer_generation = 0  # Bumped every time the mixer is (re)opened
+
+def _ensure_mixer(device: Optional[str] = None) -> int:
+    """
+    Initialize the pygame mixer once, re-opening it only to switch devices.
+    
+    Args:
+        device: Audio device name, or None to keep the current/default device
+        
+    Returns:
+        int: Current mixer generation; Sounds decoded under an older one are stale
+    """
+    global _mixer_device, _mixer_generation
+    with _mixer_lock:
+        if pygame.mixer.get_init():
+            if device is None or device == _mixer_device:
+                return _mixer_generation
+            pygame.mixer.quit()
+        if device is None:
+            pygame.mixer.init()
+        else:
+            pygame.mixer.init(devicename=device)
+        _mixer_device = device
+        _mixer_generation += 1
+        return _mixer_generation
+
 class MP3Player:
     """
     A music player class for playing MP3 files with volume control.
     
     This class provides functionality to play MP3 files with proper
-    error handling, volume control, and device management.
+    error handling, volume control, and device management. The file is
+    decoded into a pygame Sound on first use (or by preload()) and played
+    on a mixer channel.
     
     Example:
         with MP3Player("/path/to/song.mp3") as player:
@@ -23,7 +54,6 @@ class MP3Player:
     MIN_VOLUME = 0.0
     MAX_VOLUME = 1.0
     DEFAULT_VOLUME = 0.7
-    TICK_RATE = 10  # FPS for the playback loop
     
     def __init__(self, file_path: Union[str, Path], volume: float = DEFAULT_VOLUME) -> None:
         """
@@ -38,24 +68,74 @@ class MP3Player:
             FileNotFoundError: If the MP3 file doesn't exist
         """
         self.file_path = Path(file_path)
-        self.is_playing = False
         self.logger = logging.getLogger(__name__)
         self._volume = self._validate_volume(volume)
-        self._thread: Optional[threading.Thread] = None
+        self._channel: Optional[pygame.mixer.Channel] = None
+        self._sound: Optional[pygame.mixer.Sound] = None
+        self._sound_generation = 0
         
         # Validate file exists
         if not self.file_path.exists():
             raise FileNotFoundError(f"MP3 file not found: {self.file_path}")
         
         if not self.file_path.suffix.lower() in ['.mp3', '.wav', '.ogg']:
-            self.logger.warning(f"File {self.file_path} may not be a supported audio format")
+            self.logger.warning("File %s may not be a supported audio format", self.file_path)
+        
+        # The shared mixer is opened by the first preload()/play(), so players
+        # that are never used don't start SDL audio
+        self.logger.info("MP3Player initialized for file: %s", self.file_path)
+
+    def _load_sound(self, generation: int) -> None:
+        """
+        Decode the file into a Sound so play() only has to start a channel.
+        
+        Args:
+            generation: Mixer generation the Sound is decoded under
+        """
+        self._sound = pygame.mixer.Sound(str(self._decoded_path()))
+        self._sound_generation = generation
+
+    def _decoded_path(self) -> Path:
+        """
+        Pick the file to load, preferring a WAV written by precompile_audio.py.
         
+        Returns:
+            Path: The sibling WAV if it is at least as new as the source, else the source
+        """
+        wav_path = self.file_path.with_suffix('.wav')
+        if wav_path != self.file_path:
+            try:
+                if wav_path.stat().st_mtime >= self.file_path.stat().st_mtime:
+                    return wav_path
+            except OSError:
+                pass
+        return self.file_path
+
+    def preload(self) -> bool:
+        """
+        Decode the file now instead of on the first play().
+        
+        Returns:
+            bool: True if the Sound is ready, False otherwise
+        """
         try:
-            pygame.mixer.init()  # Initialize the pygame mixer module
-            self.logger.info(f"MP3Player initialized for file: {self.file_path}")
-        except pygame.error as e:
-            self.logger.error(f"Failed to initialize pygame mixer: {e}")
-            raise RuntimeError(f"Audio system initialization failed: {e}")
+            generation = _ensure_mixer()
+            if self._sound is None or generation != self._sound_generation:
+                self._load_sound(generation)
+            return True
+        except Exception as e:
+            self.logger.error("Error loading audio file %s: %s", self.file_path, e)
+            return False
+
+    @property
+    def is_playing(self) -> bool:
+        """
+        Whether this player's channel is currently busy.
+        
+        Returns:
+            bool: True if playing, False otherwise
+        """
+        return self._channel is not None and self._channel.get_busy()
 
     def get_devices(self, capture_devices: bool = False) -> Tuple[str, ...]:
         """
@@ -68,15 +148,12 @@ class MP3Player:
             Tuple of available device names
         """
         try:
-            init_by_me = not pygame.mixer.get_init()
-            if init_by_me:
-                pygame.mixer.init()
-            devices = tuple(sdl2_audio.get_audio_device_names(capture_devices))
-            if init_by_me:
-                pygame.mixer.quit()
-            return devices
+            # Enumeration needs SDL audio up; the shared mixer is left open
+            # for the play() that usually follows instead of being torn down
+            _ensure_mixer()
+            return tuple(sdl2_audio.get_audio_device_names(capture_devices))
         except Exception as e:
-            self.logger.error(f"Error getting audio devices: {e}")
+            self.logger.error("Error getting audio devices: %s", e)
             return tuple()
     
     def set_volume(self, volume: float) -> bool:
@@ -93,17 +170,16 @@ class MP3Player:
             validated_volume = self._validate_volume(volume)
             self._volume = validated_volume
             
-            # Apply volume to pygame mixer if it's initialized
-            if pygame.mixer.get_init():
-                pygame.mixer.music.set_volume(validated_volume)
+            if self._sound is not None:
+                self._sound.set_volume(validated_volume)
             
-            self.logger.info(f"Volume set to {validated_volume:.2f}")
+            self.logger.info("Volume set to %.2f", validated_volume)
             return True
         except ValueError as e:
-            self.logger.error(f"Invalid volume level: {e}")
+            self.logger.error("Invalid volume level: %s", e)
             return False
         except Exception as e:
-            self.logger.error(f"Error setting volume: {e}")
+            self.logger.error("Error setting volume: %s", e)
             return False
     
     def get_volume(self) -> float:
@@ -119,6 +195,10 @@ class MP3Player:
         """
         Validate and clamp volume value.
         
+        Anything float() accepts is taken, numeric strings included, so
+        this stays cheap on the set_volume() path; volumes read from scene
+        config are type-checked where they are read.
+        
         Args:
             volume: Volume value to validate
             
@@ -126,12 +206,20 @@ class MP3Player:
             float: Validated volume value
             
         Raises:
-            ValueError: If volume is not a number
+            ValueError: If volume is not a number or is NaN
         """
-        if not isinstance(volume, (int, float)):
-            raise ValueError("Volume must be a number")
+        try:
+            volume = float(volume)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Volume must be a number") from e
         
-        return max(self.MIN_VOLUME, min(self.MAX_VOLUME, float(volume)))
+        if volume != volume:
+            raise ValueError("Volume must not be NaN")
+        if volume < self.MIN_VOLUME:
+            return self.MIN_VOLUME
+        if volume > self.MAX_VOLUME:
+            return self.MAX_VOLUME
+        return volume
 
     def play(self, device: Optional[str] = None) -> bool:
         """
@@ -147,60 +235,25 @@ class MP3Player:
             self.logger.warning("Already playing audio")
             return False
         
-        if not self.file_path.exists():
-            self.logger.error(f"File '{self.file_path}' does not exist")
-            return False
-        
         try:
-            # Start playing the MP3 file in a separate thread
-            self._thread = threading.Thread(target=self._play_in_thread, args=(device,))
-            self._thread.daemon = True  # Allow program to exit even if thread is running
-            self._thread.start()
-            self.logger.info(f"Started playing: {self.file_path}")
+            generation = _ensure_mixer(device)
+            if self._sound is None or generation != self._sound_generation:
+                # Not decoded yet, or the mixer was re-opened on another device
+                self._load_sound(generation)
+            self._sound.set_volume(self._volume)
+            # SDL mixes the channel on its own audio thread
+            self._channel = self._sound.play()
+            if self._channel is None:
+                self.logger.error("No free mixer channel available")
+                return False
+            self.logger.info("Started playing: %s", self.file_path)
             return True
-        except Exception as e:
-            self.logger.error(f"Error starting playback: {e}")
-            return False
-
-    def _play_in_thread(self, device: Optional[str] = None) -> None:
-        """
-        Internal method to play audio in a separate thread.
-        
-        Args:
-            device: Audio device name to use for playback
-        """
-        try:
-            if device is None:
-                devices = self.get_devices()
-                self.logger.debug(f"Available devices: {devices}")
-                if not devices:
-                    self.logger.error("No audio devices available")
-                    return
-                device = devices[0]
-                self.logger.info(f"Using audio device: {device}")
-            
-            pygame.mixer.init(devicename=device)
-            self.is_playing = True
-            
-            # Set volume before playing
-            pygame.mixer.music.set_volume(self._volume)
-            
-            pygame.mixer.music.load(str(self.file_path))
-            pygame.mixer.music.play()
-            
-            # Wait until the music finishes playing
-            clock = pygame.time.Clock()
-            while pygame.mixer.music.get_busy() and self.is_playing:
-                clock.tick(self.TICK_RATE)  # Keep the thread alive while the music plays
-            
-            self.logger.info("Playback finished")
-            
         except pygame.error as e:
-            self.logger.error(f"Pygame error during playback: {e}")
+            self.logger.error("Pygame error during playback: %s", e)
+            return False
         except Exception as e:
-            self.logger.error(f"Unexpected error during playback: {e}")
-        finally:
-            self.is_playing = False
+            self.logger.error("Error starting playback: %s", e)
+            return False
 
     def stop(self) -> bool:
         """
@@ -211,15 +264,14 @@ class MP3Player:
         """
         try:
             if self.is_playing:
-                pygame.mixer.music.stop()
-                self.is_playing = False
+                self._channel.stop()
                 self.logger.info("Playback stopped")
                 return True
             else:
                 self.logger.warning("No playback in progress")
                 return False
         except Exception as e:
-            self.logger.error(f"Error stopping playback: {e}")
+            self.logger.error("Error stopping playback: %s", e)
             return False
     
     def pause(self) -> bool:
@@ -231,14 +283,14 @@ class MP3Player:
         """
         try:
             if self.is_playing:
-                pygame.mixer.music.pause()
+                self._channel.pause()
                 self.logger.info("Playback paused")
                 return True
             else:
                 self.logger.warning("No playback in progress")
                 return False
         except Exception as e:
-            self.logger.error(f"Error pausing playback: {e}")
+            self.logger.error("Error pausing playback: %s", e)
             return False
     
     def unpause(self) -> bool:
@@ -249,11 +301,14 @@ class MP3Player:
             bool: True if resumed successfully, False otherwise
         """
         try:
-            pygame.mixer.music.unpause()
+            if self._channel is None:
+                self.logger.warning("No playback in progress")
+                return False
+            self._channel.unpause()
             self.logger.info("Playback resumed")
             return True
         except Exception as e:
-            self.logger.error(f"Error resuming playback: {e}")
+            self.logger.error("Error resuming playback: %s", e)
             return False
     
     def is_playing_audio(self) -> bool:
@@ -263,7 +318,7 @@ class MP3Player:
         Returns:
             bool: True if playing, False otherwise
         """
-        return self.is_playing and pygame.mixer.music.get_busy()
+        return self.is_playing
     
     def cleanup(self) -> None:
         """
@@ -273,13 +328,10 @@ class MP3Player:
             if self.is_playing:
                 self.stop()
             
-            # Wait for thread to finish if it's still running
-            if self._thread and self._thread.is_alive():
-                self._thread.join(timeout=1.0)
-            
+            self._channel = None
             self.logger.info("MP3Player cleaned up")
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
     
     def __enter__(self):
         """
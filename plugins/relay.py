@@ -1,10 +1,68 @@
 import RPi.GPIO as GPIO
+from plugins.gpio_common import VALID_BCM_PINS, ensure_bcm_mode
+import sched
 import time
 import threading
 import logging
 from typing import Optional, Callable
 from threading import Event, Thread
 
+# timed_on() deadlines for every Relay are served by one shared daemon thread
+_timer_lock = threading.Lock()
+_timer_wakeup = Event()  # Set when a deadline is added so the thread re-checks
+_timer_thread: Optional[Thread] = None
+
+def _timer_delay(timeout: float) -> None:
+    """
+    Wait for the next deadline, waking early if a new one is scheduled.
+    
+    Args:
+        timeout: Seconds until the earliest scheduled deadline
+    """
+    _timer_wakeup.wait(timeout)
+    _timer_wakeup.clear()
+
+_timer_scheduler = sched.scheduler(time.monotonic, _timer_delay)
+
+def _run_timers() -> None:
+    """Run due deadlines, then sleep until another one is scheduled."""
+    while True:
+        _timer_scheduler.run()
+        _timer_wakeup.wait()
+        _timer_wakeup.clear()
+
+def _schedule_timer(delay: float, action: Callable[[], None]) -> sched.Event:
+    """
+    Run an action after a delay on the shared timer thread.
+    
+    Args:
+        delay: Delay in seconds
+        action: Callable to run; it must not raise
+        
+    Returns:
+        sched.Event: Handle that can be passed to _cancel_timer()
+    """
+    global _timer_thread
+    with _timer_lock:
+        entry = _timer_scheduler.enter(delay, 0, action)
+        if _timer_thread is None:
+            _timer_thread = Thread(target=_run_timers, name="relay-timer", daemon=True)
+            _timer_thread.start()
+    _timer_wakeup.set()
+    return entry
+
+def _cancel_timer(entry: sched.Event) -> None:
+    """
+    Cancel a scheduled action if it has not run yet.
+    
+    Args:
+        entry: Handle returned by _schedule_timer()
+    """
+    try:
+        _timer_scheduler.cancel(entry)
+    except ValueError:
+        pass  # Already run
+
 class Relay:
     """
     A relay control class for Raspberry Pi GPIO.
@@ -46,25 +104,33 @@ class Relay:
         self.logger = logging.getLogger(__name__)
         self._pulse_thread: Optional[Thread] = None
         self._stop_pulse_event = Event()
+        self._stop_timer_event = Event()  # Set by cleanup() to cut pulse() short
+        self._off_timer: Optional[sched.Event] = None  # Pending timed_on() turn-off
         self._is_initialized = False
         
+        # GPIO levels for ON and OFF, resolved once instead of on every write
+        if active_high:
+            self._on_level, self._off_level = GPIO.HIGH, GPIO.LOW
+        else:
+            self._on_level, self._off_level = GPIO.LOW, GPIO.HIGH
+        
         # Validate pin number
         if not self._validate_pin(pin):
             raise ValueError(f"Invalid pin number: {pin}")
         
         try:
             # Set up GPIO
-            GPIO.setmode(GPIO.BCM)
+            ensure_bcm_mode()
             GPIO.setup(self.pin, GPIO.OUT)
             
             # Set initial state
             self._set_gpio_state(initial_state)
             self._is_initialized = True
             
-            self.logger.info(f"Relay initialized on GPIO {pin} (Active: {'HIGH' if active_high else 'LOW'})")
+            self.logger.info("Relay initialized on GPIO %d (Active: %s)", pin, 'HIGH' if active_high else 'LOW')
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize relay: {e}")
+            self.logger.error("Failed to initialize relay: %s", e)
             raise RuntimeError(f"GPIO setup failed: {e}")
     
     def _set_gpio_state(self, state: bool) -> None:
@@ -75,12 +141,9 @@ class Relay:
             state: True for ON, False for OFF
         """
         try:
-            if self.active_high:
-                GPIO.output(self.pin, GPIO.HIGH if state else GPIO.LOW)
-            else:
-                GPIO.output(self.pin, GPIO.LOW if state else GPIO.HIGH)
+            GPIO.output(self.pin, self._on_level if state else self._off_level)
         except Exception as e:
-            self.logger.error(f"Error setting GPIO state: {e}")
+            self.logger.error("Error setting GPIO state: %s", e)
     
     def _validate_pin(self, pin: int) -> bool:
         """
@@ -92,9 +155,7 @@ class Relay:
         Returns:
             bool: True if pin is valid, False otherwise
         """
-        # Valid BCM pin numbers (excluding reserved pins)
-        valid_pins = [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27]
-        return pin in valid_pins
+        return pin in VALID_BCM_PINS
     
     def _validate_duration(self, duration: float) -> bool:
         """
@@ -122,10 +183,10 @@ class Relay:
         try:
             self.state = True
             self._set_gpio_state(True)
-            self.logger.info(f"Relay on GPIO {self.pin} turned ON")
+            self.logger.debug("Relay on GPIO %d turned ON", self.pin)
             return True
         except Exception as e:
-            self.logger.error(f"Error turning relay ON: {e}")
+            self.logger.error("Error turning relay ON: %s", e)
             return False
     
     def off(self) -> bool:
@@ -142,10 +203,10 @@ class Relay:
         try:
             self.state = False
             self._set_gpio_state(False)
-            self.logger.info(f"Relay on GPIO {self.pin} turned OFF")
+            self.logger.debug("Relay on GPIO %d turned OFF", self.pin)
             return True
         except Exception as e:
-            self.logger.error(f"Error turning relay OFF: {e}")
+            self.logger.error("Error turning relay OFF: %s", e)
             return False
     
     def toggle(self) -> bool:
@@ -181,16 +242,17 @@ class Relay:
             raise ValueError(f"Duration must be between {self.MIN_DURATION} and {self.MAX_DURATION} seconds")
         
         try:
-            self.logger.info(f"Pulsing relay on GPIO {self.pin} for {duration} seconds...")
+            self.logger.info("Pulsing relay on GPIO %d for %s seconds...", self.pin, duration)
+            self._stop_timer_event.clear()
             if not self.on():
                 return False
-            time.sleep(duration)
+            self._stop_timer_event.wait(duration)
             if not self.off():
                 return False
-            self.logger.info(f"Pulse complete on GPIO {self.pin}")
+            self.logger.info("Pulse complete on GPIO %d", self.pin)
             return True
         except Exception as e:
-            self.logger.error(f"Error during pulse: {e}")
+            self.logger.error("Error during pulse: %s", e)
             self.off()  # Ensure relay is turned off on error
             return False
     
@@ -220,26 +282,28 @@ class Relay:
         if stop_event is None:
             stop_event = self._stop_pulse_event
         
-        self.logger.info(f"Starting pulse pattern on GPIO {self.pin}: {on_time}s ON, {off_time}s OFF")
+        self.logger.info("Starting pulse pattern on GPIO %d: %ss ON, %ss OFF", self.pin, on_time, off_time)
         
         pulse_count = 0
         
         try:
+            # Edges are written straight to the pin (on()/off() would log each
+            # one) and timed against absolute deadlines, so waits don't drift
+            set_gpio_state = self._set_gpio_state
+            next_edge = time.monotonic()
             while not stop_event.is_set():
                 # Turn relay ON
-                if not self.on():
-                    break
-                
-                # Wait for ON time with periodic stop checks
-                if self._sleep_with_stop_check(on_time, stop_event):
+                self.state = True
+                set_gpio_state(True)
+                next_edge += on_time
+                if self._sleep_with_stop_check(next_edge - time.monotonic(), stop_event):
                     break
                 
                 # Turn relay OFF
-                if not self.off():
-                    break
-                
-                # Wait for OFF time with periodic stop checks
-                if self._sleep_with_stop_check(off_time, stop_event):
+                self.state = False
+                set_gpio_state(False)
+                next_edge += off_time
+                if self._sleep_with_stop_check(next_edge - time.monotonic(), stop_event):
                     break
                 
                 # Increment counter
@@ -250,12 +314,12 @@ class Relay:
                     break
                     
         except KeyboardInterrupt:
-            self.logger.info(f"Pulse pattern interrupted on GPIO {self.pin}")
+            self.logger.info("Pulse pattern interrupted on GPIO %d", self.pin)
         except Exception as e:
-            self.logger.error(f"Error in pulse pattern: {e}")
+            self.logger.error("Error in pulse pattern: %s", e)
         finally:
             self.off()
-            self.logger.info(f"Pulse pattern complete on GPIO {self.pin} ({pulse_count} pulses)")
+            self.logger.info("Pulse pattern complete on GPIO %d (%d pulses)", self.pin, pulse_count)
             return pulse_count
     
     def _sleep_with_stop_check(self, duration: float, stop_event: Event) -> bool:
@@ -269,12 +333,8 @@ class Relay:
         Returns:
             bool: True if stopped early, False if completed normally
         """
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            if stop_event.is_set():
-                return True
-            time.sleep(0.01)  # Small sleep to prevent busy waiting
-        return False
+        # Wakes as soon as the event is set rather than polling for it
+        return stop_event.wait(max(duration, 0.0))
     
     def start_pulse_pattern(self, on_time: float = 1.0, off_time: float = 1.0, count: Optional[int] = None) -> bool:
         """
@@ -306,10 +366,10 @@ class Relay:
                 daemon=True
             )
             self._pulse_thread.start()
-            self.logger.info(f"Started pulse pattern thread on GPIO {self.pin}")
+            self.logger.info("Started pulse pattern thread on GPIO %d", self.pin)
             return True
         except Exception as e:
-            self.logger.error(f"Error starting pulse pattern: {e}")
+            self.logger.error("Error starting pulse pattern: %s", e)
             return False
     
     def stop_pulse_pattern(self) -> bool:
@@ -324,13 +384,13 @@ class Relay:
                 self._stop_pulse_event.set()
                 self._pulse_thread.join(timeout=self.THREAD_TIMEOUT)
                 self.off()
-                self.logger.info(f"Pulse pattern stopped on GPIO {self.pin}")
+                self.logger.info("Pulse pattern stopped on GPIO %d", self.pin)
                 return True
             else:
                 self.logger.debug("No active pulse pattern to stop")
                 return True
         except Exception as e:
-            self.logger.error(f"Error stopping pulse pattern: {e}")
+            self.logger.error("Error stopping pulse pattern: %s", e)
             return False
     
     def timed_on(self, duration: float) -> bool:
@@ -354,23 +414,33 @@ class Relay:
             raise ValueError(f"Duration must be between {self.MIN_DURATION} and {self.MAX_DURATION} seconds")
         
         try:
-            self.logger.info(f"Turning relay on GPIO {self.pin} ON for {duration} seconds...")
+            self.logger.info("Turning relay on GPIO %d ON for %s seconds...", self.pin, duration)
             if not self.on():
                 return False
             
-            # Use threading to avoid blocking
-            def turn_off_after_delay():
-                time.sleep(duration)
-                self.off()
-                self.logger.info(f"Timed ON complete on GPIO {self.pin}")
-            
-            timer_thread = Thread(target=turn_off_after_delay, daemon=True)
-            timer_thread.start()
+            # The shared timer thread turns it off, so no thread is created per call
+            self._cancel_off_timer()
+            self._off_timer = _schedule_timer(duration, self._timed_off)
             return True
         except Exception as e:
-            self.logger.error(f"Error starting timed ON: {e}")
+            self.logger.error("Error starting timed ON: %s", e)
             return False
     
+    def _timed_off(self) -> None:
+        """Turn the relay OFF at the end of a timed_on() period."""
+        self._off_timer = None
+        try:
+            self.off()
+            self.logger.info("Timed ON complete on GPIO %d", self.pin)
+        except Exception as e:
+            self.logger.error("Error ending timed ON: %s", e)
+    
+    def _cancel_off_timer(self) -> None:
+        """Cancel a pending timed_on() turn-off, if any."""
+        if self._off_timer is not None:
+            _cancel_timer(self._off_timer)
+            self._off_timer = None
+    
     def get_state(self) -> bool:
         """
         Get the current state of the relay.
@@ -397,12 +467,14 @@ class Relay:
         to ensure proper GPIO cleanup.
         """
         try:
+            self._stop_timer_event.set()
+            self._cancel_off_timer()
             self.stop_pulse_pattern()
             self.off()
             self._is_initialized = False
-            self.logger.info(f"Relay on GPIO {self.pin} cleaned up")
+            self.logger.info("Relay on GPIO %d cleaned up", self.pin)
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
     
     def __enter__(self):
         """
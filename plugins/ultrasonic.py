@@ -1,8 +1,13 @@
 import RPi.GPIO as GPIO
+from plugins.gpio_common import VALID_BCM_PINS, ensure_bcm_mode
 import time
+import statistics
 import threading
 import logging
-from typing import Optional, List, Callable, Dict, Any
+import queue
+from collections import deque
+from itertools import islice
+from typing import Optional, List, Callable, Dict, Any, Sequence, Deque
 from threading import Thread, Event
 
 class UltrasonicSensor:
@@ -22,6 +27,7 @@ class UltrasonicSensor:
     
     # Constants
     SPEED_OF_SOUND = 34300  # cm/s
+    CM_PER_ECHO_NS = SPEED_OF_SOUND / 2 / 1e9  # one-way cm per ns of round-trip echo
     TRIGGER_PULSE_DURATION = 0.00001  # 10μs
     MIN_DISTANCE = 2.0  # cm (minimum reliable distance)
     MAX_DISTANCE_DEFAULT = 400.0  # cm (HC-SR04 max range)
@@ -29,8 +35,12 @@ class UltrasonicSensor:
     DEFAULT_CHANGE_THRESHOLD = 5.0  # cm
     DEFAULT_MONITOR_INTERVAL = 0.1  # seconds
     MAX_HISTORY_DEFAULT = 10
-    READING_DELAY = 0.05  # seconds between readings
+    DEFAULT_SMOOTHING_ALPHA = 0.3  # weight of the newest reading in the smoothed distance
+    READING_DELAY = 0.06  # seconds from one ping to the next (HC-SR04 datasheet minimum)
+    ECHO_START_TIMEOUT = 0.005  # seconds; the echo normally rises ~0.5ms after the trigger
+    ECHO_TIMEOUT_MARGIN = 1.1  # slack on the longest echo max_distance can produce
     THREAD_TIMEOUT = 2.0  # seconds
+    SETTLE_TIME = 0.1  # seconds after setup before the first ping
     
     def __init__(self, trigger_pin: int, echo_pin: int, max_distance: float = MAX_DISTANCE_DEFAULT, timeout: float = DEFAULT_TIMEOUT) -> None:
         """
@@ -66,10 +76,23 @@ class UltrasonicSensor:
         if not self._validate_timeout(timeout):
             raise ValueError(f"Timeout must be between 0.01 and 1.0 seconds")
         
+        # Echoes longer than this are beyond max_distance and would be discarded
+        # anyway, so stop waiting for them there
+        echo_timeout = min(timeout, 2 * max_distance / self.SPEED_OF_SOUND * self.ECHO_TIMEOUT_MARGIN)
+        self._echo_timeout_ns = int(echo_timeout * 1e9)
+        
         # Measurement tracking
         self.last_reading: Optional[float] = None
-        self.reading_history: List[float] = []
+        self._measured_at = float('-inf')  # monotonic time of the last ping
+        self._measured_value: Optional[float] = None
+        self._echo_lost = False  # Timeouts are logged once until an echo returns
+        self._settled_at = 0.0  # monotonic time the sensor is ready for its first ping
+        self._echo_edges: List[int] = []  # perf_counter_ns of the echo's rise and fall
+        self._echo_received = Event()  # Set once both echo edges are in
         self.max_history = self.MAX_HISTORY_DEFAULT
+        self.reading_history: Deque[float] = deque(maxlen=self.max_history)  # Oldest readings drop off
+        self.smoothing_alpha = self.DEFAULT_SMOOTHING_ALPHA
+        self._ema: Optional[float] = None  # Exponential moving average of valid readings
         
         # Change detection
         self.change_threshold = self.DEFAULT_CHANGE_THRESHOLD
@@ -84,69 +107,117 @@ class UltrasonicSensor:
         self._monitor_thread: Optional[Thread] = None
         self._stop_monitoring_event = Event()
         self.monitor_interval = self.DEFAULT_MONITOR_INTERVAL
+        # While monitoring, callbacks run on their own thread so a slow one
+        # can't delay the next reading
+        self._callback_queue: Optional[queue.SimpleQueue] = None
+        self._callback_thread: Optional[Thread] = None
         
         try:
             # Set up GPIO
-            GPIO.setmode(GPIO.BCM)
+            ensure_bcm_mode()
             GPIO.setup(self.trigger_pin, GPIO.OUT)
             GPIO.setup(self.echo_pin, GPIO.IN)
             
             # Ensure trigger is low initially
             GPIO.output(self.trigger_pin, GPIO.LOW)
             
-            # Small delay to let sensor settle
-            time.sleep(0.1)
+            # Echo edges are timestamped from RPi.GPIO's edge callback, so a
+            # reading blocks on an Event instead of polling the pin
+            GPIO.add_event_detect(self.echo_pin, GPIO.BOTH, callback=self._on_echo_edge)
+            
+            # Let the sensor settle before its first ping. This is waited out on
+            # first use rather than here, so several sensors settle in parallel.
+            self._settled_at = time.monotonic() + self.SETTLE_TIME
             
             self._is_initialized = True
-            self.logger.info(f"Ultrasonic sensor initialized - Trigger: GPIO {trigger_pin}, Echo: GPIO {echo_pin}")
+            self.logger.info("Ultrasonic sensor initialized - Trigger: GPIO %d, Echo: GPIO %d", trigger_pin, echo_pin)
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize ultrasonic sensor: {e}")
+            self.logger.error("Failed to initialize ultrasonic sensor: %s", e)
             raise RuntimeError(f"GPIO setup failed: {e}")
     
+    def _wait_until_settled(self) -> None:
+        """Sleep off whatever remains of the settle time after setup."""
+        remaining = self._settled_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+    
     def _send_trigger_pulse(self) -> None:
         """Send a 10μs trigger pulse."""
         try:
             GPIO.output(self.trigger_pin, GPIO.HIGH)
-            time.sleep(self.TRIGGER_PULSE_DURATION)
+            # time.sleep() overshoots a 10μs sleep several times over, so spin
+            pulse_end = time.perf_counter() + self.TRIGGER_PULSE_DURATION
+            while time.perf_counter() < pulse_end:
+                pass
             GPIO.output(self.trigger_pin, GPIO.LOW)
         except Exception as e:
-            self.logger.error(f"Error sending trigger pulse: {e}")
+            self.logger.error("Error sending trigger pulse: %s", e)
+    
+    def _on_echo_edge(self, channel: int) -> None:
+        """
+        Timestamp an echo edge. Runs on RPi.GPIO's event thread.
+        
+        The first edge after the echo is armed is the rise and the second
+        the fall, so the pin level doesn't need reading back.
+        
+        Args:
+            channel: Echo pin that changed
+        """
+        edges = self._echo_edges
+        if len(edges) < 2:
+            edges.append(time.perf_counter_ns())
+            if len(edges) == 2:
+                self._echo_received.set()
+    
+    def _arm_echo(self) -> bool:
+        """
+        Get ready to timestamp the echo of the next trigger pulse.
+        
+        Returns:
+            bool: True if armed, False if the echo of an earlier ping is
+            still high (the sensor ignores triggers until it ends)
+        """
+        if GPIO.input(self.echo_pin) == GPIO.HIGH:
+            self.logger.debug("Echo still high from the previous ping")
+            return False
+        self._echo_edges = []
+        self._echo_received.clear()
+        return True
     
-    def _wait_for_echo(self, timeout: Optional[float] = None) -> Optional[float]:
+    def _wait_for_echo(self, timeout: Optional[float] = None) -> Optional[int]:
         """
-        Wait for echo signal and measure duration.
+        Wait for the armed echo and measure its duration.
+        
+        Blocks until the edge callback has seen the echo rise and fall,
+        leaving the CPU free while the ping is in flight. Both edges pick
+        up the same callback latency, so it mostly cancels out of the
+        measured duration.
         
         Args:
-            timeout: Timeout in seconds (uses default if None)
+            timeout: Timeout for the echo pulse in seconds (defaults to the
+                longest echo within max_distance)
             
         Returns:
-            Echo duration in seconds, or None if timeout or error
+            Echo duration in nanoseconds, or None if timeout or error
         """
-        if timeout is None:
-            timeout = self.timeout
+        timeout_ns = self._echo_timeout_ns if timeout is None else int(timeout * 1e9)
         
         try:
-            # Wait for echo to start (LOW to HIGH)
-            start_time = time.time()
-            while GPIO.input(self.echo_pin) == GPIO.LOW:
-                if time.time() - start_time > timeout:
-                    return None
-            
-            # Record echo start time
-            echo_start = time.time()
-            
-            # Wait for echo to end (HIGH to LOW)
-            while GPIO.input(self.echo_pin) == GPIO.HIGH:
-                if time.time() - echo_start > timeout:
-                    return None
+            # The sensor raises echo within about half a millisecond of the trigger
+            if not self._echo_received.wait(self.ECHO_START_TIMEOUT + timeout_ns / 1e9):
+                return None
             
-            # Calculate echo duration
-            echo_end = time.time()
-            return echo_end - echo_start
+            # Timed in integer nanoseconds with perf_counter_ns, which subtract
+            # exactly where float seconds lose precision on a large counter value
+            echo_start, echo_end = self._echo_edges
+            echo_ns = echo_end - echo_start
+            if echo_ns > timeout_ns:
+                return None
+            return echo_ns
             
         except Exception as e:
-            self.logger.error(f"Error waiting for echo: {e}")
+            self.logger.error("Error waiting for echo: %s", e)
             return None
     
     def _validate_pin(self, pin: int) -> bool:
@@ -159,9 +230,7 @@ class UltrasonicSensor:
         Returns:
             bool: True if pin is valid, False otherwise
         """
-        # Valid BCM pin numbers (excluding reserved pins)
-        valid_pins = [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27]
-        return pin in valid_pins
+        return pin in VALID_BCM_PINS
     
     def _validate_distance(self, distance: float) -> bool:
         """
@@ -187,10 +256,14 @@ class UltrasonicSensor:
         """
         return 0.01 <= timeout <= 1.0
     
-    def read_distance(self) -> Optional[float]:
+    def read_distance(self, max_age: float = 0.0) -> Optional[float]:
         """
         Read distance measurement from the ultrasonic sensor.
         
+        Args:
+            max_age: Reuse the previous measurement if it is younger than this
+                many seconds instead of pinging again (0 always measures)
+        
         Returns:
             Distance in centimeters, or None if no valid reading
         """
@@ -198,38 +271,99 @@ class UltrasonicSensor:
             self.logger.error("Ultrasonic sensor not initialized")
             return None
         
+        if max_age > 0 and time.monotonic() - self._measured_at < max_age:
+            return self._measured_value
+        
+        distance = self._measure_distance()
+        self._measured_at = time.monotonic()
+        self._measured_value = distance
+        return distance
+    
+    def _measure_distance(self) -> Optional[float]:
+        """
+        Trigger the sensor and convert the echo into a distance.
+        
+        Returns:
+            Distance in centimeters, or None if no valid reading
+        """
         try:
-            # Send trigger pulse
-            self._send_trigger_pulse()
+            self._wait_until_settled()
             
-            # Wait for echo and measure duration
-            echo_duration = self._wait_for_echo()
-            
-            if echo_duration is None:
-                self.logger.debug("Ultrasonic sensor timeout - no echo received")
-                return None
-            
-            # Calculate distance (speed of sound = 34300 cm/s)
-            # Distance = (time * speed) / 2 (divide by 2 for round trip)
-            distance = (echo_duration * self.SPEED_OF_SOUND) / 2
-            
-            # Check if distance is within valid range
-            if distance < self.MIN_DISTANCE:
-                self.logger.debug(f"Distance {distance:.1f}cm below minimum {self.MIN_DISTANCE}cm")
+            if not self._arm_echo():
                 return None
             
-            if distance > self.max_distance:
-                self.logger.debug(f"Distance {distance:.1f}cm exceeds maximum {self.max_distance}cm")
-                return None
+            # Send trigger pulse
+            self._send_trigger_pulse()
             
-            # Update tracking
-            self._update_reading(distance)
+            # Wait for echo and measure duration
+            echo_ns = self._wait_for_echo()
             
-            return distance
+            return self._process_echo(echo_ns)
             
         except Exception as e:
-            self.logger.error(f"Error reading ultrasonic sensor: {e}")
+            self.logger.error("Error reading ultrasonic sensor: %s", e)
+            return None
+    
+    def _process_echo(self, echo_ns: Optional[int]) -> Optional[float]:
+        """
+        Convert an echo duration into a distance and record it.
+        
+        Args:
+            echo_ns: Echo pulse length in nanoseconds, or None on timeout
+            
+        Returns:
+            Distance in centimeters, or None if no valid reading
+        """
+        if echo_ns is None:
+            # With nothing in range every ping times out, so only log the first
+            if not self._echo_lost:
+                self._echo_lost = True
+                self.logger.debug("Ultrasonic sensor timeout - no echo received")
+            return None
+        self._echo_lost = False
+        
+        # Distance = (time * speed of sound) / 2 for the round trip, with the
+        # constants folded into CM_PER_ECHO_NS
+        distance = echo_ns * self.CM_PER_ECHO_NS
+        
+        # Check if distance is within valid range
+        if distance < self.MIN_DISTANCE:
+            self.logger.debug("Distance %.1fcm below minimum %scm", distance, self.MIN_DISTANCE)
+            return None
+        
+        if distance > self.max_distance:
+            self.logger.debug("Distance %.1fcm exceeds maximum %scm", distance, self.max_distance)
             return None
+        
+        # Update tracking
+        self._update_reading(distance)
+        
+        return distance
+    
+    @staticmethod
+    def read_distances(sensors: Sequence["UltrasonicSensor"]) -> List[Optional[float]]:
+        """
+        Read several sensors in turn, READING_DELAY apart.
+        
+        Sensors facing the same way hear each other's pings. One fired while
+        a neighbour's ping is still in the air can take the neighbour's
+        reflection for its own echo and read far too short, so each ping is
+        given READING_DELAY to die away before the next sensor fires.
+        
+        Args:
+            sensors: Sensors to read
+            
+        Returns:
+            Distance in cm (or None) for each sensor, in the same order
+        """
+        results: List[Optional[float]] = []
+        next_ping = time.monotonic()
+        for sensor in sensors:
+            # The previous sensor's echo wait already used part of the quiet period
+            time.sleep(max(0.0, next_ping - time.monotonic()))
+            next_ping = time.monotonic() + UltrasonicSensor.READING_DELAY
+            results.append(sensor.read_distance())
+        return results
     
     def _update_reading(self, distance: float) -> None:
         """
@@ -247,48 +381,95 @@ class UltrasonicSensor:
             
             # Add to history
             self.reading_history.append(distance)
-            if len(self.reading_history) > self.max_history:
-                self.reading_history.pop(0)
+            
+            # Fold into the smoothed distance; O(1) per reading and no extra pings
+            if self._ema is None:
+                self._ema = distance
+            else:
+                self._ema += self.smoothing_alpha * (distance - self._ema)
             
             # Check for significant changes
+            change_info = None
             if previous_reading is not None:
                 change = abs(distance - previous_reading)
                 if change >= self.change_threshold:
-                    self.last_significant_change = {
+                    change_info = {
                         'from': previous_reading,
                         'to': distance,
                         'change': change,
                         'timestamp': time.time()
                     }
+                    self.last_significant_change = change_info
                     
-                    self.logger.debug(f"Significant change detected: {previous_reading:.1f}cm -> {distance:.1f}cm (Δ{change:.1f}cm)")
-                    
-                    # Call change callback if set
-                    if self.change_callback:
-                        try:
-                            self.change_callback(self.last_significant_change)
-                        except Exception as e:
-                            self.logger.error(f"Error in change callback: {e}")
-            
-            # Call distance callback if set
-            if self.distance_callback:
-                try:
-                    self.distance_callback(distance)
-                except Exception as e:
-                    self.logger.error(f"Error in distance callback: {e}")
+                    self.logger.debug("Significant change detected: %.1fcm -> %.1fcm (Δ%.1fcm)", previous_reading, distance, change)
+            
+            if self.distance_callback or (change_info and self.change_callback):
+                callback_queue = self._callback_queue
+                if callback_queue is not None:
+                    callback_queue.put((distance, change_info))
+                else:
+                    self._run_callbacks(distance, change_info)
                     
         except Exception as e:
-            self.logger.error(f"Error updating reading: {e}")
+            self.logger.error("Error updating reading: %s", e)
+    
+    def _run_callbacks(self, distance: float, change_info: Optional[Dict[str, Any]]) -> None:
+        """
+        Call the change and distance callbacks for one reading.
+        
+        Args:
+            distance: Distance reading in cm
+            change_info: Significant change information, or None if the
+                reading wasn't a significant change
+        """
+        # Call change callback if set
+        if change_info and self.change_callback:
+            try:
+                self.change_callback(change_info)
+            except Exception as e:
+                self.logger.error("Error in change callback: %s", e)
+        
+        # Call distance callback if set
+        if self.distance_callback:
+            try:
+                self.distance_callback(distance)
+            except Exception as e:
+                self.logger.error("Error in distance callback: %s", e)
+    
+    def _callback_loop(self, callback_queue: queue.SimpleQueue) -> None:
+        """
+        Run queued callbacks until the None sentinel arrives.
+        
+        Args:
+            callback_queue: Queue of (distance, change_info) pairs
+        """
+        while True:
+            item = callback_queue.get()
+            if item is None:
+                break
+            self._run_callbacks(*item)
+    
+    def _stop_callback_thread(self) -> None:
+        """Stop queueing callbacks and let the callback thread finish the backlog."""
+        callback_queue = self._callback_queue
+        self._callback_queue = None
+        if callback_queue is not None:
+            callback_queue.put(None)
     
     def get_average_distance(self, samples: int = 5) -> Optional[float]:
         """
         Get average distance from multiple readings.
         
+        The median is used rather than the mean, so one spurious echo in
+        the batch doesn't drag the result. This pings the sensor samples
+        times; get_smoothed_distance() is free when readings are already
+        being taken.
+        
         Args:
             samples: Number of samples to average (1-20)
             
         Returns:
-            Average distance in cm, or None if no valid readings
+            Median distance in cm, or None if no valid readings
             
         Raises:
             ValueError: If samples is out of range
@@ -303,22 +484,26 @@ class UltrasonicSensor:
         try:
             readings = []
             
-            for _ in range(samples):
+            next_ping = time.monotonic()
+            for sample in range(samples):
+                if sample:
+                    # The echo wait already used part of the quiet period
+                    time.sleep(max(0.0, next_ping - time.monotonic()))
+                next_ping = time.monotonic() + self.READING_DELAY
                 distance = self.read_distance()
                 if distance is not None:
                     readings.append(distance)
-                time.sleep(self.READING_DELAY)
             
             if not readings:
                 self.logger.warning("No valid readings obtained for average")
                 return None
             
-            average = sum(readings) / len(readings)
-            self.logger.debug(f"Average distance from {len(readings)} readings: {average:.1f}cm")
+            average = statistics.median(readings)
+            self.logger.debug("Median distance from %d readings: %.1fcm", len(readings), average)
             return average
             
         except Exception as e:
-            self.logger.error(f"Error getting average distance: {e}")
+            self.logger.error("Error getting average distance: %s", e)
             return None
     
     def get_reading_history(self) -> List[float]:
@@ -328,7 +513,7 @@ class UltrasonicSensor:
         Returns:
             Copy of the reading history list
         """
-        return self.reading_history.copy()
+        return list(self.reading_history)
     
     def get_last_reading(self) -> Optional[float]:
         """
@@ -339,6 +524,15 @@ class UltrasonicSensor:
         """
         return self.last_reading
     
+    def get_smoothed_distance(self) -> Optional[float]:
+        """
+        Get the exponential moving average of the valid readings so far.
+        
+        Returns:
+            Smoothed distance in cm, or None if no readings
+        """
+        return self._ema
+    
     def get_last_change(self) -> Optional[Dict[str, Any]]:
         """
         Get information about the last significant change.
@@ -359,11 +553,11 @@ class UltrasonicSensor:
             bool: True if threshold was set successfully, False otherwise
         """
         if not 0.1 <= threshold <= 100.0:
-            self.logger.error(f"Change threshold must be between 0.1 and 100.0 cm, got {threshold}")
+            self.logger.error("Change threshold must be between 0.1 and 100.0 cm, got %s", threshold)
             return False
         
         self.change_threshold = threshold
-        self.logger.info(f"Change threshold set to {threshold}cm")
+        self.logger.info("Change threshold set to %scm", threshold)
         return True
     
     def set_distance_callback(self, callback: Callable[[float], None]) -> None:
@@ -405,7 +599,7 @@ class UltrasonicSensor:
             return False
         
         if not 0.01 <= interval <= 1.0:
-            self.logger.error(f"Monitoring interval must be between 0.01 and 1.0 seconds, got {interval}")
+            self.logger.error("Monitoring interval must be between 0.01 and 1.0 seconds, got %s", interval)
             return False
         
         try:
@@ -413,14 +607,19 @@ class UltrasonicSensor:
             self.monitor_interval = interval
             self._stop_monitoring_event.clear()
             
+            self._callback_queue = queue.SimpleQueue()
+            self._callback_thread = Thread(target=self._callback_loop, args=(self._callback_queue,), daemon=True)
+            self._callback_thread.start()
+            
             self._monitor_thread = Thread(target=self._monitor_loop, daemon=True)
             self._monitor_thread.start()
             
-            self.logger.info(f"Started continuous monitoring (interval: {interval}s)")
+            self.logger.info("Started continuous monitoring (interval: %ss)", interval)
             return True
         except Exception as e:
-            self.logger.error(f"Error starting monitoring: {e}")
+            self.logger.error("Error starting monitoring: %s", e)
             self.monitoring = False
+            self._stop_callback_thread()
             return False
     
     def stop_monitoring(self) -> bool:
@@ -441,28 +640,30 @@ class UltrasonicSensor:
             if self._monitor_thread and self._monitor_thread.is_alive():
                 self._monitor_thread.join(timeout=self.THREAD_TIMEOUT)
             
+            # The monitor loop stops the callback thread on its way out
+            if self._callback_thread and self._callback_thread.is_alive():
+                self._callback_thread.join(timeout=self.THREAD_TIMEOUT)
+            
             self.logger.info("Stopped continuous monitoring")
             return True
         except Exception as e:
-            self.logger.error(f"Error stopping monitoring: {e}")
+            self.logger.error("Error stopping monitoring: %s", e)
             return False
     
     def _monitor_loop(self) -> None:
         """Internal monitoring loop."""
         try:
-            while self.monitoring and not self._stop_monitoring_event.is_set():
+            while self.monitoring:
                 self.read_distance()
                 
-                # Sleep with periodic stop checks
-                start_time = time.time()
-                while time.time() - start_time < self.monitor_interval:
-                    if self._stop_monitoring_event.is_set():
-                        break
-                    time.sleep(0.01)
+                # Block until the next reading is due; stop_monitoring() wakes this at once
+                if self._stop_monitoring_event.wait(self.monitor_interval):
+                    break
         except Exception as e:
-            self.logger.error(f"Error in monitoring loop: {e}")
+            self.logger.error("Error in monitoring loop: %s", e)
         finally:
             self.monitoring = False
+            self._stop_callback_thread()
     
     def detect_movement(self, samples: int = 3, threshold: float = 10.0) -> bool:
         """
@@ -480,16 +681,16 @@ class UltrasonicSensor:
             return False
         
         if not 2 <= samples <= 10:
-            self.logger.error(f"Samples must be between 2 and 10, got {samples}")
+            self.logger.error("Samples must be between 2 and 10, got %s", samples)
             return False
         
         if len(self.reading_history) < samples:
-            self.logger.debug(f"Not enough readings for movement detection (need {samples}, have {len(self.reading_history)})")
+            self.logger.debug("Not enough readings for movement detection (need %d, have %d)", samples, len(self.reading_history))
             return False
         
         try:
             # Get last few readings
-            recent_readings = self.reading_history[-samples:]
+            recent_readings = list(islice(self.reading_history, len(self.reading_history) - samples, None))
             
             # Check for significant variation
             min_reading = min(recent_readings)
@@ -498,11 +699,11 @@ class UltrasonicSensor:
             
             movement_detected = variation > threshold
             if movement_detected:
-                self.logger.debug(f"Movement detected: variation {variation:.1f}cm > threshold {threshold}cm")
+                self.logger.debug("Movement detected: variation %.1fcm > threshold %scm", variation, threshold)
             
             return movement_detected
         except Exception as e:
-            self.logger.error(f"Error detecting movement: {e}")
+            self.logger.error("Error detecting movement: %s", e)
             return False
     
     def is_object_present(self, threshold: float = 30.0) -> bool:
@@ -525,7 +726,7 @@ class UltrasonicSensor:
         
         object_present = self.last_reading < threshold
         if object_present:
-            self.logger.debug(f"Object detected: {self.last_reading:.1f}cm < threshold {threshold}cm")
+            self.logger.debug("Object detected: %.1fcm < threshold %scm", self.last_reading, threshold)
         
         return object_present
     
@@ -547,10 +748,12 @@ class UltrasonicSensor:
         """
         try:
             self.stop_monitoring()
+            if self._is_initialized:
+                GPIO.remove_event_detect(self.echo_pin)
             self._is_initialized = False
-            self.logger.info(f"Ultrasonic sensor on GPIO {self.trigger_pin}/{self.echo_pin} cleaned up")
+            self.logger.info("Ultrasonic sensor on GPIO %d/%d cleaned up", self.trigger_pin, self.echo_pin)
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
     
     def __enter__(self):
         """
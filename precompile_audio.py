@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Audio Precompiler for Halloween Coffin System
+
+This script decodes every MP3 in music_files/ once and writes the PCM
+next to it as a WAV file. MP3Player loads the WAV when it is present and
+up to date, so playback never has to run the MP3 decoder on the Pi.
+
+Run it again whenever an MP3 is added or replaced.
+"""
+
+import os
+import sys
+import wave
+import logging
+from pathlib import Path
+
+import pygame
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+MUSIC_DIR = Path(os.path.dirname(os.path.abspath(__file__))) / 'music_files'
+
+def precompile_file(mp3_path: Path) -> bool:
+    """
+    Decode a single MP3 file to a sibling WAV in the mixer's sample format.
+
+    Args:
+        mp3_path: Path to the MP3 file
+
+    Returns:
+        bool: True if the WAV was written, False otherwise
+    """
+    wav_path = mp3_path.with_suffix('.wav')
+    try:
+        frequency, size, channels = pygame.mixer.get_init()
+        sample_width = abs(size) // 8
+        if sample_width not in (1, 2):
+            logger.error(f"Unsupported mixer sample size: {size} bits")
+            return False
+
+        raw = pygame.mixer.Sound(str(mp3_path)).get_raw()
+        with wave.open(str(wav_path), 'wb') as wav_file:
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(sample_width)
+            wav_file.setframerate(frequency)
+            wav_file.writeframes(raw)
+
+        logger.info(f"Wrote {wav_path.name} ({len(raw) / 1024:.0f} KiB)")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to precompile {mp3_path}: {e}")
+        return False
+
+def main() -> int:
+    """Main entry point."""
+    mp3_files = sorted(MUSIC_DIR.glob('*.mp3'))
+    if not mp3_files:
+        logger.error(f"No MP3 files found in {MUSIC_DIR}")
+        return 1
+
+    pygame.mixer.init()
+    try:
+        failures = sum(not precompile_file(mp3_path) for mp3_path in mp3_files)
+    finally:
+        pygame.mixer.quit()
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tests for UltrasonicSensor against a simulated pair of HC-SR04 sensors.
+
+RPi.GPIO is replaced with a fake that models the sensors' pings in real
+time, so these run off the Pi:
+
+    python -m unittest tests/test_ultrasonic.py
+"""
+
+import sys
+import time
+import heapq
+import threading
+import unittest
+from unittest import mock
+
+SPEED_OF_SOUND = 34300  # cm/s
+BURST_DELAY = 0.0005  # seconds from the trigger to the ping (and the echo rising)
+NO_ECHO_TIMEOUT = 0.038  # seconds an HC-SR04 holds echo high with nothing in range
+
+class FakeGPIO:
+    """
+    Stand-in for RPi.GPIO driving simulated HC-SR04 sensors.
+
+    Every sensor faces the same target, so a ping from one reflects back
+    to all of them. A sensor's echo rises when it pings and falls at the
+    first reflection to reach it afterwards, whichever sensor sent it,
+    as real sensors do.
+    """
+
+    BCM = 11
+    OUT = 0
+    IN = 1
+    LOW = 0
+    HIGH = 1
+    RISING = 31
+    FALLING = 32
+    BOTH = 33
+
+    def __init__(self) -> None:
+        self.sensors = {}  # trigger pin -> echo pin
+        self.target_distance = None  # cm, or None for nothing in range
+        self._levels = {}
+        self._callbacks = {}
+        self._events = []
+        self._sequence = 0
+        self._condition = threading.Condition()
+        threading.Thread(target=self._run_events, daemon=True).start()
+
+    def add_sensor(self, trigger_pin: int, echo_pin: int) -> None:
+        self.sensors[trigger_pin] = echo_pin
+
+    def setmode(self, mode) -> None:
+        pass
+
+    def setup(self, pin, direction) -> None:
+        pass
+
+    def cleanup(self, *args) -> None:
+        pass
+
+    def input(self, pin):
+        return self._levels.get(pin, self.LOW)
+
+    def add_event_detect(self, pin, edge, callback=None) -> None:
+        self._callbacks[pin] = callback
+
+    def remove_event_detect(self, pin) -> None:
+        self._callbacks.pop(pin, None)
+
+    def output(self, pin, value) -> None:
+        # The sensor pings when its trigger pulse ends
+        if value == self.LOW and self._levels.get(pin) == self.HIGH and pin in self.sensors:
+            self._ping(self.sensors[pin], time.perf_counter() + BURST_DELAY)
+        self._levels[pin] = value
+
+    def _ping(self, echo_pin: int, at: float) -> None:
+        if self._levels.get(echo_pin) == self.HIGH:
+            return  # A sensor still listening ignores its trigger
+        self._schedule(at, self._set_echo, echo_pin, self.HIGH)
+        self._schedule(at + NO_ECHO_TIMEOUT, self._set_echo, echo_pin, self.LOW)
+        if self.target_distance is not None:
+            arrival = at + 2 * self.target_distance / SPEED_OF_SOUND
+            for other_echo_pin in self.sensors.values():
+                self._schedule(arrival, self._set_echo, other_echo_pin, self.LOW)
+
+    def _set_echo(self, echo_pin: int, level) -> None:
+        if self._levels.get(echo_pin, self.LOW) == level:
+            return
+        self._levels[echo_pin] = level
+        callback = self._callbacks.get(echo_pin)
+        if callback:
+            callback(echo_pin)
+
+    def _schedule(self, at: float, function, *args) -> None:
+        with self._condition:
+            self._sequence += 1
+            heapq.heappush(self._events, (at, self._sequence, function, args))
+            self._condition.notify()
+
+    def _run_events(self) -> None:
+        # Edge callbacks run here, one at a time, like RPi.GPIO's event thread
+        while True:
+            with self._condition:
+                while not self._events:
+                    self._condition.wait()
+                at, sequence, function, args = self._events[0]
+                remaining = at - time.perf_counter()
+                if remaining > 0.001:
+                    self._condition.wait(remaining - 0.001)
+                    continue
+            while time.perf_counter() < at:
+                pass
+            with self._condition:
+                if self._events[0][1] != sequence:
+                    continue
+                heapq.heappop(self._events)
+            function(*args)
+
+FAKE_GPIO = FakeGPIO()
+
+with mock.patch.dict(sys.modules, {'RPi': mock.MagicMock(GPIO=FAKE_GPIO), 'RPi.GPIO': FAKE_GPIO}):
+    from plugins.ultrasonic import UltrasonicSensor
+
+class UltrasonicSensorTest(unittest.TestCase):
+
+    TOLERANCE = 5.0  # cm
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Hand the GIL between the test and the simulated sensors often
+        # enough for sub-millisecond echo timing
+        cls.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(0.00005)
+        FAKE_GPIO.add_sensor(8, 7)
+        FAKE_GPIO.add_sensor(23, 24)
+        cls.sensor_1 = UltrasonicSensor(trigger_pin=8, echo_pin=7)
+        cls.sensor_2 = UltrasonicSensor(trigger_pin=23, echo_pin=24)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.sensor_1.cleanup()
+        cls.sensor_2.cleanup()
+        sys.setswitchinterval(cls.switch_interval)
+
+    def setUp(self) -> None:
+        # Let any echo left over from the previous test die away
+        time.sleep(UltrasonicSensor.READING_DELAY)
+
+    def test_read_distance_times_the_echo(self) -> None:
+        FAKE_GPIO.target_distance = 120.0
+
+        distance = self.sensor_1.read_distance()
+
+        self.assertIsNotNone(distance)
+        self.assertAlmostEqual(distance, 120.0, delta=self.TOLERANCE)
+
+    def test_read_distance_without_echo(self) -> None:
+        FAKE_GPIO.target_distance = None
+
+        self.assertIsNone(self.sensor_1.read_distance())
+
+    def test_read_distances_ignores_neighbour_ping(self) -> None:
+        # A target beyond ~94cm used to reach a sensor fired 5ms after its
+        # neighbour as the neighbour's reflection, reading ~26cm
+        FAKE_GPIO.target_distance = 120.0
+
+        for _ in range(3):
+            distances = UltrasonicSensor.read_distances((self.sensor_1, self.sensor_2))
+            for distance in distances:
+                self.assertIsNotNone(distance)
+                self.assertAlmostEqual(distance, 120.0, delta=self.TOLERANCE)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+YAML Cache for Halloween Coffin System
+
+This module parses YAML configuration files once and serves later loads
+from memory until the file on disk changes.
+"""
+
+import copy
+import os
+import logging
+from collections import OrderedDict
+from typing import Any, Tuple
+
+import yaml
+
+try:
+    # libyaml C parser, roughly an order of magnitude faster than pure Python
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+logger = logging.getLogger(__name__)
+
+if _Loader is not getattr(yaml, 'CSafeLoader', None):
+    # PyYAML silently falls back to pure Python when built without libyaml
+    logger.warning("libyaml not available, YAML files will be parsed by the pure-Python SafeLoader")
+
+# Maximum number of parsed files kept in memory
+MAX_CACHE_ENTRIES = 8
+
+# path -> ((st_mtime_ns, st_size), parsed data)
+_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+
+
+def load_yaml(path: str) -> Any:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content (a private copy the caller may modify)
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == key:
+        _cache.move_to_end(path)
+        return copy.deepcopy(cached[1])
+
+    # Binary mode lets libyaml handle decoding itself
+    with open(path, 'rb') as file:
+        data = yaml.load(file, Loader=_Loader)
+    logger.debug(f"Parsed YAML file: {path} ({_Loader.__name__})")
+
+    _cache[path] = (key, data)
+    _cache.move_to_end(path)
+    while len(_cache) > MAX_CACHE_ENTRIES:
+        _cache.popitem(last=False)
+
+    return copy.deepcopy(data)